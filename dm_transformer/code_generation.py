@@ -33,7 +33,7 @@ def generate_init(class_name: str, class_details: dict) -> List[str]:
         "self",
         *[f"{attr}: {details['type']}=None" for attr, details in attributes.items()],
         *[
-            f"{ref}: List['{ref_details['type']}']=[]" if ref_details['multiplicity'] == 'multi' 
+            f"{ref}: List['{ref_details['type']}']=None" if ref_details['multiplicity'] == 'multi' 
             else f"{ref}: '{ref_details['type']}'=None" 
             for ref, ref_details in references.items()
         ]
@@ -44,7 +44,7 @@ def generate_init(class_name: str, class_details: dict) -> List[str]:
     # Initialize a list to hold lines of the __init__ method
     init_lines = [
         f"{' ' * 4}def __init__({param_string}):",
-        f"{' ' * 4}    if not key:",
+        f"{' ' * 4}    if key is None:",
         f"{' ' * 4}        raise ValueError('Attribute key is required')",
         f"{' ' * 4}    super().__init__(key=key, mini_mode=mini_mode)"
     ]
@@ -72,10 +72,14 @@ def generate_init(class_name: str, class_details: dict) -> List[str]:
         for ref, details in references.items():
             if details.get("required"):
                 init_lines.extend([
-                    f"{' ' * 12}if not {ref}:",
+                    f"{' ' * 12}if {ref} is None:",
                     f"{' ' * 12}    raise ValueError('Reference {ref} is required')"
                 ])
-            init_lines.append(f"{' ' * 12}self.{ref}: " + (f"List ['{details['type']}']" if details['multiplicity'] == 'multi' else f"'{details['type']}'") + f" = {ref}")
+            if details['multiplicity'] == 'multi':
+                # Every instance gets its own list, never the caller's or a shared one
+                init_lines.append(f"{' ' * 12}self.{ref}: List ['{details['type']}'] = list({ref}) if {ref} else []")
+            else:
+                init_lines.append(f"{' ' * 12}self.{ref}: '{details['type']}' = {ref}")
 
     init_lines.append("")
     return init_lines
@@ -130,10 +134,8 @@ def generate_upgrade(class_details: dict) -> List[str]:
                 f"{' ' * 8}    raise ValueError('Reference {ref} is required for upgrade')"
             ])
         if details["multiplicity"] == "multi":
-            upgrade_lines.extend([
-                f"{' ' * 8}if {ref} is not None:",
-                f"{' ' * 8}    self.{ref}.extend({ref})"
-            ])
+            # A reduced object has no list of its own yet
+            upgrade_lines.append(f"{' ' * 8}self.{ref} = list({ref}) if {ref} is not None else getattr(self, '{ref}', [])")
         else:
             upgrade_lines.append(f"{' ' * 8}self.{ref} = {ref} if {ref} is not None else getattr(self, '{ref}', None)")
     
@@ -216,16 +218,12 @@ def generate_class_code(class_name: str, class_details: dict) -> str:
             class_code.append('')
         return "\n".join(class_code)
 
+    # Name of the key attribute, ModelObject makes the key available under it
+    if key_name != 'key':
+        class_code.extend([f"{' ' * 4}key_name = '{key_name}'", ""])
     # Generate list of constructor params (all optional - generator functions handle required checks)
     class_code.extend(generate_init(class_name, class_details))
     # Add upgrade function
     class_code.extend(generate_upgrade(class_details))
-    # Add key attribute also as property
-    class_code.extend([
-        "",
-        f"{' ' * 4}@property",
-        f"{' ' * 4}def {class_details['key']}(self):",
-        f"{' ' * 4}    return self.key"
-        ])
     # 
     return "\n".join(class_code)
\ No newline at end of file
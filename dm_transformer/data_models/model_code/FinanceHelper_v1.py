@@ -1,5 +1,4 @@
 from typing import List, Optional, Union
-from abc import ABC
 from datetime import datetime
 from src.core import *
 import json
@@ -12,10 +11,12 @@ register = {}
 
 class PayAcc(ModelObject):
 
+    key_name = 'name'
+
     def __init__(self,
                  key: str=None, *,
                    mini_mode=False):
-        if not key:
+        if key is None:
             raise ValueError('Attribute key is required')
         super().__init__(key=key, mini_mode=mini_mode)
         self.transactions: 'Collection' = Collection(PayAcc, key, 'transactions', Tx)
@@ -29,16 +30,14 @@ class PayAcc(ModelObject):
         self._mini_mode = False
         return True
 
-    @property
-    def name(self):
-        return self.key
-
 class InvAcc(ModelObject):
 
+    key_name = 'name'
+
     def __init__(self,
                  key: str=None, *,
                    mini_mode=False):
-        if not key:
+        if key is None:
             raise ValueError('Attribute key is required')
         super().__init__(key=key, mini_mode=mini_mode)
         self.transactions: 'Collection' = Collection(InvAcc, key, 'transactions', Tx)
@@ -52,10 +51,6 @@ class InvAcc(ModelObject):
         self._mini_mode = False
         return True
 
-    @property
-    def name(self):
-        return self.key
-
 class Tx(Composite):
     def __init__(self, amount: float, description: str, timestamp: datetime):
         self.amount = amount
@@ -1,6 +1,4 @@
 from typing import List, Optional, Union
-from abc import ABC
-from datetime import datetime
 from dm_transformer.data_models.model_code.core import ModelEntity
 import math
 
@@ -13,21 +11,21 @@ register = {}
 
 class Number(ModelEntity):
 
-    factors: List ['Number'] = []
+    factors: List ['Number']
 
     def __init__(self,
                  key: str=None,
                  prime: bool=None,
                  factors: List['Number']=None, *,
                    mini_mode=False):
-        if not key:
+        if key is None:
             raise ValueError('Attribute key is required')
         super().__init__(key=key, mini_mode=mini_mode)
         if not mini_mode:
             if prime is None:
                 raise ValueError('Attribute Prime is required')
             self.prime = prime
-            self.factors = factors if factors is not None else []
+            self.factors = list(factors) if factors else []
 
     def upgrade(self,
                 prime: bool=None,
@@ -38,8 +36,7 @@ class Number(ModelEntity):
         if prime is None:
             raise ValueError('Attribute Prime is required for upgrade')
         self.prime = prime if prime is not None else getattr(self, 'Prime', None)
-        if factors is not None:
-            self.factors.extend(factors)
+        self.factors = list(factors) if factors is not None else getattr(self, 'factors', [])
         # Indicate successful upgrade
         self._mini_mode = False
         return True
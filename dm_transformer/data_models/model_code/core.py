@@ -1,23 +1,62 @@
 from typing import Union, List, Dict, Optional
 from datetime import datetime
 import importlib
+import sys
 
 class ModelEntity:
     """ 
     Base class for all model entities. 
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
 
-class ModelObject(ModelEntity):
+class StrCacheMixin:
+    """
+    Memoizes the string representation of an object, e.g. for the object listings sent with every response.
+    Subclasses implement _render() instead of __str__. The cached string is stored together with the key it was
+    rendered for and reused as long as the key is the same object, so _render() should only depend on the key.
+    Classes whose string depends on other attributes override __str__ instead.
+    """
+    __slots__ = ('_str_cache',)
+
+    def __init__(self, *args, **kwargs):
+        self._str_cache = None
+        super().__init__(*args, **kwargs)
+
+    def __str__(self):
+        cached = self._str_cache
+        if cached is not None and cached[0] is self.key:
+            return cached[1]
+        text = self._render()
+        self._str_cache = (self.key, text)
+        return text
+
+    def _render(self) -> str:
+        return super().__str__()
+
+
+class ModelObject(StrCacheMixin, ModelEntity):
     """
     Superclass for all ModelObject types. 
     Represents entities that have a unique identifier and can be loaded in full or reduced modes.
     """
+    __slots__ = ('key', '_mini_mode')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A key_name other than key makes the key available under that name too, sharing the key slot descriptor
+        key_name = cls.__dict__.get('key_name')
+        if key_name and key_name != 'key':
+            setattr(cls, key_name, ModelObject.key)
+
     def __init__(self, key: str, mini_mode: bool = False):
         super().__init__()
-        self._key = key
+        # Interned, so register lookups with the same key mostly compare by identity. Only str keys can be interned,
+        # others (e.g. the ints of numeric keys) are kept as they are
+        self.key = sys.intern(key) if type(key) is str else key
         self._mini_mode = mini_mode
     
     @classmethod
@@ -32,15 +71,11 @@ class ModelObject(ModelEntity):
         self._mini_mode = False
         return True
 
-    @property
-    def key(self):
-        return self._key
-
     @property
     def mini_mode(self):
         return self._mini_mode
 
-    def __str__(self):
+    def _render(self):
         return f'[{self.__class__.__name__}] {self.key}'
 
 
@@ -49,6 +84,8 @@ class Composite(ModelEntity):
     Superclass for all Composite types.
     Represents entities that do not have a unique key and are often used as data points.
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -1,8 +1,14 @@
+import typing
 from typing import List, Optional, Union
-from abc import ABC
-from datetime import datetime
+import dataclasses
+from dataclasses import dataclass, field, InitVar
+import sys
+import weakref
 from dm_transformer.data_models.model_code.core import ModelEntity
 
+if typing.TYPE_CHECKING:
+    from datetime import datetime
+
 INVERSE_RELATIONSHIPS = {
     'direct_constituents': 'parents',
     'conduits_in': 'target',
@@ -13,262 +19,260 @@ INVERSE_RELATIONSHIPS = {
 
 register = {}
 
-class ModelObject(ABC):
-
-    active_from: datetime
-    active_until: datetime
-
-
-class Unit(ModelEntity):
-
-
-    def __init__(self,
-                 key: str=None, *,
-                   mini_mode=False):
-        if not key:
+# Results of the traversal helpers at the end of this module, per start entity and traversal
+_traversal_cache = weakref.WeakKeyDictionary()
+# References the traversals follow, setting any of them through upgrade() drops the cached results
+_traversed_references = frozenset(('parents', 'direct_constituents', 'conduits_in', 'origin'))
+
+class ModelObject:
+
+    __slots__ = ('active_from', 'active_until')
+    active_from: 'datetime'
+    active_until: 'datetime'
+
+
+class CheckedEntity(ModelEntity):
+    """
+    Base of the dataclass entities below. The generated __init__ assigns the fields, __post_init__ checks the key
+    and, unless the entity is created in mini mode, the required attributes and references.
+    The fields keep the positional order of the former hand-written __init__ methods, key included.
+    upgrade() is shared as well: multi references given to it are appended to the lists, other values replace
+    the current ones.
+    """
+    __slots__ = ()
+    required_attributes = ()
+    required_references = ()
+    multi_references = ()
+
+    def __post_init__(self, mini_mode):
+        if self.key is None:
             raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
-
-    def upgrade(self):
+        if type(self.key) is str:
+            self.key = sys.intern(self.key)
+        self._mini_mode = mini_mode
+        if not mini_mode:
+            for attr in self.required_attributes:
+                if getattr(self, attr) is None:
+                    raise ValueError(f'Attribute {attr} is required')
+            for ref in self.required_references:
+                if getattr(self, ref) is None:
+                    raise ValueError(f'Reference {ref} is required')
+
+    def upgrade(self, **kwargs):
         # Abort if object is already in full mode
         if not self._mini_mode:
             return False
+        for attr in self.required_attributes:
+            if kwargs.get(attr) is None:
+                raise ValueError(f'Attribute {attr} is required for upgrade')
+        for ref in self.required_references:
+            if kwargs.get(ref) is None:
+                raise ValueError(f'Reference {ref} is required for upgrade')
+        multi_references = self.multi_references
+        if any(kwargs.get(name) is not None for name in _traversed_references):
+            # New edges in the graph, the cached traversals may be incomplete now
+            _traversal_cache.clear()
+        for name, value in kwargs.items():
+            # Values that aren't given keep the current ones
+            if value is None:
+                continue
+            if name in multi_references:
+                current = getattr(self, name)
+                if current:
+                    current.extend(value)
+                else:
+                    # Mini objects usually have no references yet, build the list in one go
+                    setattr(self, name, list(value))
+            else:
+                setattr(self, name, value)
         # Indicate successful upgrade
         self._mini_mode = False
         return True
 
-    @property
-    def name(self):
-        return self.key
+    def freeze(self):
+        """
+        Turns the multi references into tuples once the model is built, they take less memory and iterate faster.
+        Objects in mini mode keep their lists, as their upgrade still extends them.
+        """
+        if self._mini_mode:
+            return
+        for name in self.multi_references:
+            setattr(self, name, tuple(getattr(self, name)))
 
-class Value(ModelEntity):
 
-    value: float
-    unit: 'Unit'
-    used_in: 'ModelObject'
+# Full Unit instances by key, shared by every Value of that unit
+_units = weakref.WeakValueDictionary()
 
-    def __init__(self,
-                 value: float=None,
-                 key: str=None,
-                 unit: 'Unit'=None,
-                 used_in: 'ModelObject'=None, *,
-                   mini_mode=False):
-        if not key:
-            raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
+
+@dataclass(slots=True, eq=False, repr=False, weakref_slot=True, init=False)
+class Unit(CheckedEntity):
+
+    key: str = None
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
+
+    def __new__(cls, key: str=None, *, mini_mode=False):
+        # A Unit consists of its key only, so constructing a known one hands back the shared instance
         if not mini_mode:
-            if value is None:
-                raise ValueError('Attribute value is required')
-            self.value = value
-            if unit is None:
-                raise ValueError('Reference unit is required')
-            self.unit = unit
-            self.used_in = used_in
-
-    def upgrade(self,
-                value: float=None,
-                unit: 'Unit'=None,
-                used_in: 'ModelObject'=None):
-        if value is None:
-            raise ValueError('Attribute value is required for upgrade')
-        self.value = value if value is not None else getattr(self, 'value', None)
-        if unit is None:
-            raise ValueError('Reference unit is required for upgrade')
-        self.unit = unit if unit is not None else getattr(self, 'unit', None)
-        self.used_in = used_in if used_in is not None else getattr(self, 'used_in', None)
-        # Indicate successful upgrade
-        self._mini_mode = False
-        return True
+            unit = _units.get(key)
+            if unit is not None:
+                return unit
+        return object.__new__(cls)
+
+    def __init__(self, key: str=None, *, mini_mode=False):
+        # Written by hand, as the shared instance handed back by __new__ must not be initialized again
+        if not mini_mode and _units.get(key) is self:
+            return
+        self.key = key
+        CheckedEntity.__post_init__(self, mini_mode)
+        if not mini_mode:
+            _units.setdefault(self.key, self)
+
+    def upgrade(self, **kwargs):
+        # Explicit base call, zero-argument super() doesn't work in slotted dataclasses
+        upgraded = CheckedEntity.upgrade(self, **kwargs)
+        if upgraded:
+            # Now a full unit, share it like the ones constructed in full mode
+            _units.setdefault(self.key, self)
+        return upgraded
+
+Unit.name = Unit.key
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Value(CheckedEntity):
+
+    required_attributes = ('value',)
+    required_references = ('unit',)
+
+    value: float = None
+    key: str = None
+    unit: 'Unit' = None
+    used_in: 'ModelObject' = None
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
 
-    @property
-    def identifier(self):
-        return self.key
-    
     def __str__(self) -> str:
         return f"[Value - {self.key}] {self.value} {self.unit.name}"
 
-class Resource(ModelEntity):
+Value.identifier = Value.key
 
-    unit_default: 'Unit'
 
-    def __init__(self,
-                 key: str=None,
-                 unit_default: 'Unit'=None, *,
-                   mini_mode=False):
-        if not key:
-            raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
-        if not mini_mode:
-            if unit_default is None:
-                raise ValueError('Reference unit_default is required')
-            self.unit_default = unit_default
-
-    def upgrade(self,
-                unit_default: 'Unit'=None):
-        if unit_default is None:
-            raise ValueError('Reference unit_default is required for upgrade')
-        self.unit_default = unit_default if unit_default is not None else getattr(self, 'unit_default', None)
-        # Indicate successful upgrade
-        self._mini_mode = False
-        return True
+@dataclass(slots=True, eq=False, repr=False)
+class Resource(CheckedEntity):
 
-    @property
-    def name(self):
-        return self.key
+    required_references = ('unit_default',)
 
-class Region(ModelEntity, ModelObject):
+    key: str = None
+    unit_default: 'Unit' = None
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
 
-    osm_id: int
-    direct_constituents: List ['Region']
-    parents: List ['Region']
+Resource.name = Resource.key
 
-    def __init__(self,
-                 osm_id: int=None,
-                 key: str=None,
-                 direct_constituents: List['Region']=None,
-                 parents: List['Region']=None, *,
-                   mini_mode=False):
-        if not key:
-            raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
-        if not mini_mode:
-            self.osm_id = osm_id
-            self.direct_constituents.extend(direct_constituents)
-            self.parents.extend(parents)
-
-    def upgrade(self,
-                osm_id: int=None,
-                direct_constituents: List['Region']=None,
-                parents: List['Region']=None):
-        self.osm_id = osm_id if osm_id is not None else getattr(self, 'osm_id', None)
-        if direct_constituents is not None:
-            self.direct_constituents.extend(direct_constituents)
-        if parents is not None:
-            self.parents.extend(parents)
-        # Indicate successful upgrade
-        self._mini_mode = False
-        return True
 
-    @property
-    def name(self):
-        return self.key
-
-class Place(ModelEntity, ModelObject):
-
-    osm_id: int
-    location: tuple
-    in_region: List ['Region']
-    processed_resources: List ['Resource']
-    conduits_in: List ['Conduit']
-    conduits_out: List ['Conduit']
-
-    def __init__(self,
-                 osm_id: int=None,
-                 location: tuple=None,
-                 key: str=None,
-                 in_region: List['Region']=None,
-                 processed_resources: List['Resource']=None,
-                 conduits_in: List['Conduit']=None,
-                 conduits_out: List['Conduit']=None, *,
-                   mini_mode=False):
-        if not key:
-            raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
-        if not mini_mode:
-            self.osm_id = osm_id
-            if location is None:
-                raise ValueError('Attribute location is required')
-            self.location = location
-            self.in_region.extend(in_region)
-            self.processed_resources.extend(processed_resources)
-            self.conduits_in.extend(conduits_in)
-            self.conduits_out.extend(conduits_out)
-
-    def upgrade(self,
-                osm_id: int=None,
-                location: tuple=None,
-                in_region: List['Region']=None,
-                processed_resources: List['Resource']=None,
-                conduits_in: List['Conduit']=None,
-                conduits_out: List['Conduit']=None):
-        # Abort if object is already in full mode
-        if not self._mini_mode:
-            return False
-        self.osm_id = osm_id if osm_id is not None else getattr(self, 'osm_id', None)
-        if location is None:
-            raise ValueError('Attribute location is required for upgrade')
-        self.location = location if location is not None else getattr(self, 'location', None)
-        if in_region is not None:
-            self.in_region.extend(in_region)
-        if processed_resources is not None:
-            self.processed_resources.extend(processed_resources)
-        if conduits_in is not None:
-            self.conduits_in.extend(conduits_in)
-        if conduits_out is not None:
-            self.conduits_out.extend(conduits_out)
-        # Indicate successful upgrade
-        self._mini_mode = False
-        return True
+@dataclass(slots=True, eq=False, repr=False, weakref_slot=True)
+class Region(CheckedEntity, ModelObject):
 
-    @property
-    def identifier(self):
-        return self.key
-
-class Conduit(ModelEntity, ModelObject):
-
-    transmits_resource: 'Resource'
-    capacity: 'Value'
-    origin: 'Place'
-    target: 'Place'
-
-    def __init__(self,
-                 key: str=None,
-                 transmits_resource: 'Resource'=None,
-                 capacity: 'Value'=None,
-                 origin: 'Place'=None,
-                 target: 'Place'=None, *,
-                   mini_mode=False):
-        if not key:
-            raise ValueError('Attribute key is required')
-        super().__init__(key=key, mini_mode=mini_mode)
-        if not mini_mode:
-            if transmits_resource is None:
-                raise ValueError('Reference transmits_resource is required')
-            self.transmits_resource = transmits_resource
-            if capacity is None:
-                raise ValueError('Reference capacity is required')
-            self.capacity = capacity
-            if origin is None:
-                raise ValueError('Reference origin is required')
-            self.origin = origin
-            if target is None:
-                raise ValueError('Reference target is required')
-            self.target = target
-
-    def upgrade(self,
-                transmits_resource: 'Resource'=None,
-                capacity: 'Value'=None,
-                origin: 'Place'=None,
-                target: 'Place'=None):
-        # Abort if object is already in full mode
-        if not self._mini_mode:
-            return False
-        if transmits_resource is None:
-            raise ValueError('Reference transmits_resource is required for upgrade')
-        self.transmits_resource = transmits_resource if transmits_resource is not None else getattr(self, 'transmits_resource', None)
-        if capacity is None:
-            raise ValueError('Reference capacity is required for upgrade')
-        self.capacity = capacity if capacity is not None else getattr(self, 'capacity', None)
-        if origin is None:
-            raise ValueError('Reference origin is required for upgrade')
-        self.origin = origin if origin is not None else getattr(self, 'origin', None)
-        if target is None:
-            raise ValueError('Reference target is required for upgrade')
-        self.target = target if target is not None else getattr(self, 'target', None)
-        # Indicate successful upgrade
-        self._mini_mode = False
-        return True
+    multi_references = ('direct_constituents', 'parents')
+
+    osm_id: int = None
+    key: str = None
+    direct_constituents: List['Region'] = field(default_factory=list)
+    parents: List['Region'] = field(default_factory=list)
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
+
+Region.name = Region.key
+
+
+@dataclass(slots=True, eq=False, repr=False, weakref_slot=True)
+class Place(CheckedEntity, ModelObject):
+
+    required_attributes = ('location',)
+    multi_references = ('in_region', 'processed_resources', 'conduits_in', 'conduits_out')
+
+    osm_id: int = None
+    location: tuple = None
+    key: str = None
+    in_region: List['Region'] = field(default_factory=list)
+    processed_resources: List['Resource'] = field(default_factory=list)
+    conduits_in: List['Conduit'] = field(default_factory=list)
+    conduits_out: List['Conduit'] = field(default_factory=list)
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
+
+Place.identifier = Place.key
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Conduit(CheckedEntity, ModelObject):
+
+    required_references = ('transmits_resource', 'capacity', 'origin', 'target')
+
+    key: str = None
+    transmits_resource: 'Resource' = None
+    capacity: 'Value' = None
+    origin: 'Place' = None
+    target: 'Place' = None
+    _: dataclasses.KW_ONLY
+    mini_mode: InitVar[bool] = False
+    _mini_mode: bool = field(default=False, init=False)
+
+Conduit.identifier = Conduit.key
+
+
+# region Traversal
+
+def _traverse(entity: CheckedEntity, name: str, step) -> tuple:
+    """
+    Collect every entity reachable from the given one, memoized per entity until the graph changes through upgrade().
+    References changed directly, e.g. by appending to a list, aren't noticed, the cache has to be cleared by hand then.
+
+    Parameters:
+    entity (CheckedEntity): Entity to start from, not part of the result.
+    name (str): Name of the traversal, used as cache key.
+    step (callable): Returns the direct neighbours of an entity.
 
-    @property
-    def identifier(self):
-        return self.key
\ No newline at end of file
+    Returns:
+    tuple: Reachable entities in breadth-first order.
+    """
+    cached = _traversal_cache.get(entity)
+    if cached is None:
+        cached = _traversal_cache[entity] = {}
+    elif name in cached:
+        return cached[name]
+    seen = {entity}
+    result = []
+    frontier = [entity]
+    while frontier:
+        next_frontier = []
+        for current in frontier:
+            for neighbour in step(current):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    result.append(neighbour)
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    cached[name] = result = tuple(result)
+    return result
+
+def ancestors(region: Region) -> tuple:
+    """Returns all regions the given one is part of, directly or transitively."""
+    return _traverse(region, 'ancestors', lambda r: r.parents)
+
+def descendants(region: Region) -> tuple:
+    """Returns all regions the given one consists of, directly or transitively."""
+    return _traverse(region, 'descendants', lambda r: r.direct_constituents)
+
+def upstream_places(place: Place) -> tuple:
+    """Returns all places that transmit into the given one, directly or through other places."""
+    # Conduits in mini mode don't know their origin yet
+    return _traverse(place, 'upstream_places', lambda p: [conduit.origin for conduit in p.conduits_in if conduit.origin is not None])
+
+# endregion
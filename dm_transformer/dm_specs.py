@@ -1,23 +1,71 @@
 from lxml import etree
-import xml.etree.ElementTree as ET
-from typing import List, Tuple
+from io import BytesIO
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+import functools
+import os
+import sys
+
+# Sentinel for arguments that were not provided at all
+_MISSING = object()
 
 type_map = {
     "str": str,
     "float": float,
     "int": int,
-    "bool": bool
+    "bool": bool,
+    "tuple": tuple,
+    "datetime": datetime
+}
+
+annotation_map = {
+    "text": "str",
+    "int": "int",
+    "pos_geo": "tuple",
+    "float": "float",
+    "boolean": "bool",
+    "datetime": "datetime",
 }
 
+# (is_key, required, indexed) per bit pattern is_key | required << 1 | indexed << 2; a key attribute is always required
+_attribute_flag_table = tuple(
+    (bool(bits & 1), bool(bits & 3), bool(bits & 4)) for bits in range(8)
+)
+
 def attribute_type_to_annotation(attr_type: str) -> str:
-    return {
-        "text": "str",
-        "int": "int",
-        "pos_geo": "tuple",
-        "float": "float",
-        "boolean": "bool",
-        "datetime": "datetime",
-    }.get(attr_type, "str")
+    return annotation_map.get(attr_type, "str")
+
+@functools.lru_cache(maxsize=8)
+def _get_schema(xsd_path: str, mtime: float) -> etree.XMLSchema:
+    """
+    Compiles the XSD at the given path. Cached per (path, modification time), so an edited schema gets recompiled.
+    """
+    return etree.XMLSchema(etree.parse(xsd_path))
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ClassInfo:
+    """
+    Read-only digest of a parsed ModelObject class, built once per load for the validation hot paths.
+    The full details stay available in ModelSpecifications.model_objects.
+    """
+    name: str
+    is_abstract: bool
+    extends: Optional[str]
+    key: Optional[str]
+    attributes: Tuple[str, ...]
+    # Attribute names with the key attribute named 'key'
+    generic_attributes: Tuple[str, ...]
+    references: Tuple[str, ...]
+    collections: Tuple[str, ...]
+    # Valid argument names as sets
+    attr_names: frozenset
+    ref_names: frozenset
+    valid_keys: frozenset
+    # (name, python type / target class name, required) per attribute and reference
+    attr_validators: Tuple[Tuple[str, type, bool], ...]
+    ref_validators: Tuple[Tuple[str, str, bool], ...]
+    summary: List[str]
 
 class ModelSpecifications:
 
@@ -33,7 +81,22 @@ class ModelSpecifications:
         
         self.model_objects = {}
         self.composites = {}
-        self.indexes = []
+        # Indexed attributes, stored column-wise
+        self._index_entity_type = []
+        self._index_type_name = []
+        self._index_attr_name = []
+        # Flat (class name, attribute/reference name) lookup tables, see _build_lookup_tables
+        self._attr_type = {}
+        self._attr_required = {}
+        self._ref_type = {}
+        self._ref_multi = {}
+        self._ref_required = {}
+        # ClassInfo per class name
+        self._class_info = {}
+        # Names of all classes
+        self._class_names = frozenset()
+        # Attribute names per composite name
+        self._composite_attributes = {}
         self.xml_path = xml_path
         self.xsd_path = xsd_path
         self.load_file(xml_path, xml_content)
@@ -49,55 +112,30 @@ class ModelSpecifications:
         if xml_path is None and xml_content is None:
             raise ValueError("No XML file specified. Neither through its filepath nor directly as string.")
         
-        # Store the old xml_path
-        old_xml_path = self.xml_path
+        # Snapshot the current state. Parsing rebinds the internal data structures instead of mutating them,
+        # so a shallow copy is enough to restore the old specifications
+        snapshot = dict(self.__dict__)
         
         try:
             # Attempt to read the new XML content if a path is provided
             if xml_path:
-                with open(xml_path, 'r') as xml_file:
+                with open(xml_path, 'rb', buffering=1 << 17) as xml_file:
                     xml_content = xml_file.read()
             
-            # Reset the internal data structures
-            self.model_objects = {}
-            self.composites = {}
-            self.indexes = []
-
             # Update the XML path
             self.xml_path = xml_path
             
-            # Syntactic validation against XSD
-            self._syntactic_validate(xml_content, self.xsd_path)
-            
-            # Parse XML
-            self._parse_xml(xml_content)
+            # Parse XML, validating it against the XSD in the same pass
+            self._parse_xml(xml_content, self.xsd_path)
             
             # Semantic validation
             self._semantic_validate()
 
         except Exception as e:
-            # Revert to old xml_path in case of any error and reload old specifications
-            self.xml_path = old_xml_path
-            if old_xml_path:
-                with open(old_xml_path, 'r') as xml_file:
-                    old_xml_content = xml_file.read()
-                self._syntactic_validate(old_xml_content, self.xsd_path)
-                self._parse_xml(old_xml_content)
-                self._semantic_validate()
+            # Revert to the old xml_path and specifications in case of any error
+            self.__dict__.update(snapshot)
             raise e
 
-    def _syntactic_validate(self, xml_content, xsd_path):
-        with open(xsd_path, 'r') as xsd_file:
-            xsd_root = etree.XML(xsd_file.read())
-        
-        schema = etree.XMLSchema(xsd_root)
-        xml_parser = etree.XMLParser(schema=schema)
-        
-        try:
-            etree.fromstring(xml_content, xml_parser)
-        except etree.XMLSyntaxError as e:
-            raise ValueError(f"Syntactic validation error: {e}")
-        
     def _semantic_validate(self):        
         # Check 1: Exactly one Attribute within each non-abstract class should have is_key="true" and type="string"
         for class_name, class_info in self.model_objects.items():
@@ -116,15 +154,16 @@ class ModelSpecifications:
 
         # Check 4: Each ModelObject collection has to point to a known Composite type
 
-    def _parse_xml(self, xml_content):
+    def _parse_xml(self, xml_content, xsd_path):
         """
-        Parses the XML content to populate the internal data structures.
+        Parses the XML content to populate the internal data structures, validating it against the XSD on the fly.
 
         The XML content should have a structure where all `ModelObject` and `Composite` elements are wrapped 
         inside a `Entities` root element.
 
         Parameters:
-            xml_content (str): XML data containing the model specifications.
+            xml_content (str | bytes): XML data containing the model specifications.
+            xsd_path (str): Path to the XSD schema file.
 
         Structure of expected XML:
         <Entities>
@@ -143,79 +182,172 @@ class ModelSpecifications:
             ...
         </Entities>
         """
-        root = ET.fromstring(xml_content)
-
-        # Iterating over each 'ModelObject' element under the 'Entities' root
-        for class_elem in root.findall('ModelObject'):
-            class_name = class_elem.get('name')
-            class_info = {
-                'is_abstract': class_elem.get('is_abstract') == 'true',
-                'extends': class_elem.get('extends'),
-                'attributes': {},
-                'references': {},
-                'collections': {}
+        # Reset the internal data structures
+        self.model_objects = {}
+        self.composites = {}
+        self._index_entity_type = []
+        self._index_type_name = []
+        self._index_attr_name = []
+
+        schema = _get_schema(xsd_path, os.path.getmtime(xsd_path))
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode()
+        context = etree.iterparse(BytesIO(xml_content), events=('end',), tag=('ModelObject', 'Composite'), schema=schema,
+                                  collect_ids=False, remove_blank_text=True, remove_comments=True, remove_pis=True)
+
+        try:
+            for _, elem in context:
+                if elem.tag == 'ModelObject':
+                    self._parse_model_object(elem)
+                else:
+                    self._parse_composite(elem)
+                # Drop the handled element and its already handled siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            raise ValueError(f"Syntactic validation error: {e}")
+
+        self._build_lookup_tables()
+
+    def _build_lookup_tables(self):
+        """
+        Flattens the per-class attribute and reference details into dicts keyed by (class name, name)
+        and a ClassInfo per class, so the frequently called lookups need a single hash probe.
+        """
+        self._attr_type = {}
+        self._attr_required = {}
+        self._ref_type = {}
+        self._ref_multi = {}
+        self._ref_required = {}
+        self._class_info = {}
+        for class_name, class_info in self.model_objects.items():
+            key_name = class_info.get('key')
+            generic_attributes = tuple('key' if attr == key_name else attr for attr in class_info['attributes'])
+            attr_names = frozenset(generic_attributes)
+            ref_names = frozenset(class_info['references'])
+            self._class_info[class_name] = ClassInfo(
+                name=class_name,
+                is_abstract=class_info['is_abstract'],
+                extends=class_info['extends'],
+                key=key_name,
+                attributes=tuple(class_info['attributes']),
+                generic_attributes=generic_attributes,
+                references=tuple(class_info['references']),
+                collections=tuple(class_info['collections']),
+                attr_names=attr_names,
+                ref_names=ref_names,
+                valid_keys=attr_names | ref_names,
+                attr_validators=tuple(
+                    (attr_name, type_map[attr_info['type']], attr_info['required'])
+                    for attr_name, attr_info in class_info['attributes'].items()
+                ),
+                ref_validators=tuple(
+                    (ref_name, ref_info['type'], ref_info['required'])
+                    for ref_name, ref_info in class_info['references'].items()
+                ),
+                summary=self._build_variable_summary(class_info)
+            )
+            for attr_name, attr_info in class_info['attributes'].items():
+                self._attr_type[class_name, attr_name] = type_map[attr_info['type']]
+                self._attr_required[class_name, attr_name] = attr_info['required']
+            for ref_name, ref_info in class_info['references'].items():
+                self._ref_type[class_name, ref_name] = ref_info['type']
+                self._ref_multi[class_name, ref_name] = ref_info['multiplicity'] == 'multi'
+                self._ref_required[class_name, ref_name] = ref_info['required']
+        self._class_names = frozenset(self.model_objects)
+        self._composite_attributes = {comp_name: tuple(comp_info['attributes']) for comp_name, comp_info in self.composites.items()}
+
+    def _parse_model_object(self, class_elem):
+        """
+        Populates the internal data structures from a single 'ModelObject' element.
+
+        Parameters:
+            class_elem (etree._Element): The 'ModelObject' element.
+        """
+        class_name = sys.intern(class_elem.get('name'))
+        class_info = {
+            'is_abstract': class_elem.get('is_abstract') == 'true',
+            'extends': class_elem.get('extends'),
+            'attributes': {},
+            'references': {},
+            'collections': {}
+        }
+
+        # Parsing each 'Attribute' element under the current 'ModelObject' element
+        for attr_elem in class_elem.findall('Attribute'):
+            attr_name = sys.intern(attr_elem.text.strip())
+            is_key, required, indexed = _attribute_flag_table[
+                (attr_elem.get('is_key') == 'true')
+                | (attr_elem.get('required') == 'true') << 1
+                | (attr_elem.get('indexed') == 'true') << 2
+            ]
+            attribute_info = {
+                'type': attribute_type_to_annotation(attr_elem.get('type')),
+                'is_key': is_key,
+                'required': required,
+                'indexed': indexed
+            }
+            # If the attribute is marked as the key, store its name at the class level
+            if attribute_info['is_key']:
+                class_info['key'] = attr_name
+            class_info['attributes'][attr_name] = attribute_info
+            # If the attribute is indexed, store it in corresponding list
+            if attribute_info['indexed']:
+                self._index_entity_type.append('ModelObject')
+                self._index_type_name.append(class_name)
+                self._index_attr_name.append(attr_name)
+
+        # Parsing each 'Reference' element under the current 'ModelObject' element
+        for ref_elem in class_elem.findall('Reference'):
+            ref_name = sys.intern(ref_elem.text.strip())
+            reference_info = {
+                'type': sys.intern(ref_elem.get('type')),
+                'multiplicity': ref_elem.get('multiplicity'),
+                'required': ref_elem.get('required') == 'true',
+                'inverse': ref_elem.get('inverse')
+            }
+            class_info['references'][ref_name] = reference_info
+
+        # Parsing each 'Collection' element under the current 'ModelObject' element
+        for col_elem in class_elem.findall('Collection'):
+            col_name = sys.intern(col_elem.text.strip())
+            collection_info = {
+                'type': sys.intern(col_elem.get('type'))
             }
+            class_info['collections'][col_name] = collection_info
+
+        # Storing the parsed information for the current class
+        self.model_objects[class_name] = class_info
 
-            # Parsing each 'Attribute' element under the current 'ModelObject' element
-            for attr_elem in class_elem.findall('Attribute'):
-                attr_name = attr_elem.text.strip()
-                attribute_info = {
-                    'type': attribute_type_to_annotation(attr_elem.get('type')),
-                    'is_key': attr_elem.get('is_key') == 'true',
-                    'required': True if attr_elem.get('is_key') == 'true' else attr_elem.get('required') == 'true',
-                    'indexed': attr_elem.get('indexed') == 'true'
-                }
-                # If the attribute is marked as the key, store its name at the class level
-                if attribute_info['is_key']:
-                    class_info['key'] = attr_name
-                class_info['attributes'][attr_name] = attribute_info
-                # If the attribute is indexed, store it in corresponding list
-                if attribute_info['indexed']:
-                    self.indexes.add({'entity_type': 'ModelObject', 'type_name': class_name, 'attribute_name': attr_name})
-
-            # Parsing each 'Reference' element under the current 'ModelObject' element
-            for ref_elem in class_elem.findall('Reference'):
-                ref_name = ref_elem.text.strip()
-                reference_info = {
-                    'type': ref_elem.get('type'),
-                    'multiplicity': ref_elem.get('multiplicity'),
-                    'required': ref_elem.get('required') == 'true',
-                    'inverse': ref_elem.get('inverse')
-                }
-                class_info['references'][ref_name] = reference_info
-
-            # Parsing each 'Collection' element under the current 'ModelObject' element
-            for col_elem in class_elem.findall('Collection'):
-                col_name = col_elem.text.strip()
-                collection_info = {
-                    'type': col_elem.get('type')
-                }
-                class_info['collections'][col_name] = collection_info
-
-            # Storing the parsed information for the current class
-            self.model_objects[class_name] = class_info
-
-        # Iterating over each 'Composite' element under the 'Entities' root
-            for comp_elem in root.findall('Composite'):
-                comp_name = comp_elem.get('name')
-                comp_info = {
-                    'attributes': {}
-                }
-
-                # Parsing each 'Attribute' element under the current 'Composite' element
-                for attr_elem in comp_elem.findall('Attribute'):
-                    attr_name = attr_elem.text.strip()
-                    attribute_info = {
-                        'type': attribute_type_to_annotation(attr_elem.get('type')),
-                        'indexed': attr_elem.get('indexed') == 'true'
-                    }
-                    comp_info['attributes'][attr_name] = attribute_info
-                    # If the attribute is indexed, store it in corresponding list
-                    if attribute_info['indexed']:
-                        self.indexes.append({'entity_type': 'Composite', 'type_name': comp_name, 'attribute_name': attr_name})
-
-                # Storing the parsed information for the current class
-                self.composites[comp_name] = comp_info
+    def _parse_composite(self, comp_elem):
+        """
+        Populates the internal data structures from a single 'Composite' element.
+
+        Parameters:
+            comp_elem (etree._Element): The 'Composite' element.
+        """
+        comp_name = sys.intern(comp_elem.get('name'))
+        comp_info = {
+            'attributes': {}
+        }
+
+        # Parsing each 'Attribute' element under the current 'Composite' element
+        for attr_elem in comp_elem.findall('Attribute'):
+            attr_name = sys.intern(attr_elem.text.strip())
+            attribute_info = {
+                'type': attribute_type_to_annotation(attr_elem.get('type')),
+                'indexed': attr_elem.get('indexed') == 'true'
+            }
+            comp_info['attributes'][attr_name] = attribute_info
+            # If the attribute is indexed, store it in corresponding list
+            if attribute_info['indexed']:
+                self._index_entity_type.append('Composite')
+                self._index_type_name.append(comp_name)
+                self._index_attr_name.append(attr_name)
+
+        # Storing the parsed information for the current composite
+        self.composites[comp_name] = comp_info
 # endregion
 
 # region Helper functions
@@ -231,18 +363,50 @@ class ModelSpecifications:
         Returns:
             bool: True if the reference is valid, False otherwise.
         """
-        valid_references = [details['type'] for ref, details in self.model_objects[source_class]['references'].items() if ref == reference_name]
-        return target_class in valid_references
+        return self._ref_type.get((source_class, reference_name)) == target_class
+
+    @staticmethod
+    def _build_variable_summary(class_dict: dict) -> List[str]:
+        """
+        Builds the textual summary of the attributes and references of a class as returned by get_variable_summary.
+
+        Parameters:
+            class_dict (dict): Parsed information of the class.
+
+        Returns:
+            List[str]: List of strings summarizing each attribute and reference
+        """
+        attr_sum = [f"{key + (' (key)' if data['is_key'] else '')} : {data['type'] + ' (required)' if data['required'] else ' (optional)'}" for key, data in class_dict['attributes'].items()]
+        ref_sum = [f"{key} : {data['type'] + ' (required)' if data['required'] else ' (optional)' } ({data['multiplicity']}){' Inverse: ' + data['inverse'] if data['inverse'] else ''}" for key, data in class_dict['references'].items()]
+        return attr_sum + ref_sum
 # endregion
 
 # region Primitive functions
+    def get_class_info(self, class_name: str) -> Optional[ClassInfo]:
+        """
+        Provides the read-only digest of a given class.
+
+        Parameters:
+            class_name (str): Name of the class.
+
+        Returns:
+            ClassInfo: The digest of the class, or None if the class is unknown.
+        """
+        return self._class_info.get(class_name)
+
     def get_class_names(self) -> List[str]:
         """
         Returns all known Class names as list of strings
         """
         return list(self.model_objects.keys())
+
+    def get_class_names_set(self) -> frozenset:
+        """
+        Returns all known Class names as frozenset, for membership tests
+        """
+        return self._class_names
     
-    def get_object_attributes(self, class_name: str, indiv_key=True) -> List[str]:
+    def get_object_attributes(self, class_name: str, indiv_key=True) -> Tuple[str, ...]:
         """
         Provides the names of all attributes of a given class.
 
@@ -251,22 +415,16 @@ class ModelSpecifications:
             indiv_key (bool): Whether to use the individual key name (e.g. 'identifier') or the general key name 'key'.
 
         Returns:
-            List[str]: List of attribute names as strings
+            Tuple[str, ...]: Attribute names as strings
         """
-        class_dict = self.model_objects.get(class_name)
-        if not class_dict:
+        class_info = self._class_info.get(class_name)
+        if not class_info:
             return None
-        
-        attributes = class_dict.get('attributes', [])
 
-        # If indiv_key is False, replace the individual key name with the general 'key' name
-        if not indiv_key:
-            individual_key_name = class_dict.get('key', 'key')
-            attributes = ['key' if attr == individual_key_name else attr for attr in attributes]
-
-        return attributes
+        # If indiv_key is False, the individual key name is replaced with the general 'key' name
+        return class_info.attributes if indiv_key else class_info.generic_attributes
     
-    def get_composite_attributes(self, composite_name: str) -> List[str]:
+    def get_composite_attributes(self, composite_name: str) -> Tuple[str, ...]:
         """
         Provides the names of all attributes of a given composite.
 
@@ -274,15 +432,11 @@ class ModelSpecifications:
             composite_name (str): Name of the composite.
 
         Returns:
-            List[str]: List of attribute names as strings
+            Tuple[str, ...]: Attribute names as strings
         """
-        class_dict = self.composites.get(composite_name)
-        if not class_dict:
-            return None
-        
-        return class_dict.get('attributes', [])
+        return self._composite_attributes.get(composite_name)
 
-    def get_references(self, class_name: str) -> List[str]:
+    def get_references(self, class_name: str) -> Tuple[str, ...]:
         """
         Provides the names of all references of a given class.
 
@@ -290,10 +444,10 @@ class ModelSpecifications:
             class_name (str): Name of the class.
 
         Returns:
-            List[str]: List of reference names as strings
+            Tuple[str, ...]: Reference names as strings
         """
-        class_dict = self.model_objects.get(class_name)
-        return class_dict['references'] if class_dict else None
+        class_info = self._class_info.get(class_name)
+        return class_info.references if class_info else None
 
     def has_any_reference(self, class_name: str) -> bool:
         """
@@ -305,7 +459,7 @@ class ModelSpecifications:
         Returns:
             bool: True if the class has any variables that point to objects of other Model classes.
         """
-        return bool(self.model_objects[class_name]['references'])
+        return bool(self._class_info[class_name].references)
 
     def get_key_attribute(self, class_name: str) -> str:
         """
@@ -317,7 +471,7 @@ class ModelSpecifications:
         Returns:
             str: Name of the key attribute.
         """
-        return self.model_objects[class_name]['key']
+        return self._class_info[class_name].key
 
     def get_reference_type(self, class_name: str, reference_name: str) -> str:
         """
@@ -331,8 +485,7 @@ class ModelSpecifications:
             str: Type of the reference (e.g., another class name).
         """
         # transform to lower case
-        reference_name = reference_name.lower()
-        return self.model_objects[class_name]['references'][reference_name]['type']
+        return self._ref_type[class_name, reference_name.lower()]
 
     def get_indexes(self) -> List[dict]:
         """
@@ -343,7 +496,8 @@ class ModelSpecifications:
                         an indexed attribute, including the entity type (ModelObject/Composite),
                         the name of the ModelObject or Composite class, and the name of the indexed attribute.
         """
-        return self.indexes
+        return [{'entity_type': entity_type, 'type_name': type_name, 'attribute_name': attr_name}
+                for entity_type, type_name, attr_name in zip(self._index_entity_type, self._index_type_name, self._index_attr_name)]
 
     def is_multi_reference(self, class_name: str, reference_name: str) -> bool:
         """
@@ -357,8 +511,7 @@ class ModelSpecifications:
             bool: True if multi-reference, False otherwise.
         """
         # transform to lower case
-        reference_name = reference_name.lower()
-        return self.model_objects[class_name]['references'][reference_name]['multiplicity'] == 'multi'
+        return self._ref_multi[class_name, reference_name.lower()]
 
     def is_attribute_required(self, class_name: str, attribute_name: str) -> bool:
         """
@@ -371,7 +524,7 @@ class ModelSpecifications:
         Returns:
             bool: True if the attribute is required, False otherwise.
         """
-        return self.model_objects[class_name]['attributes'][attribute_name]['required']
+        return self._attr_required[class_name, attribute_name]
 
     def is_reference_required(self, class_name: str, reference_name: str) -> bool:
         """
@@ -384,7 +537,7 @@ class ModelSpecifications:
         Returns:
             bool: True if the reference is required, False otherwise.
         """
-        return self.model_objects[class_name]['references'][reference_name]['required']
+        return self._ref_required[class_name, reference_name]
 # endregion
 
 # region Complex functions
@@ -400,42 +553,38 @@ class ModelSpecifications:
         Returns:
             bool: True if arguments match the model specifications, False otherwise.
         """
-        class_info = self.model_objects.get(class_name)
-        if not class_info:
-            return False
-        args_copy = args.copy()
-        key_name = class_info.get('key')
-        if key_name and 'key' in args_copy:
-            args_copy[key_name] = args_copy.pop('key')
-
         # If class is not in the specifications, return False
+        class_info = self._class_info.get(class_name)
         if not class_info:
             return False
 
+        # The key may be passed under the general name 'key' instead of its individual name
+        renamed_key = class_info.key if 'key' in args else None
+
         # Validate attributes
-        for attr, info in class_info['attributes'].items():
-            attr_type = info['type']
-            is_required = info['required']
+        for attr, attr_type, is_required in class_info.attr_validators:
+            value = args.get('key' if attr == renamed_key else attr, _MISSING)
 
             # If the attribute is required but not provided, return False
-            if strict and is_required and attr not in args_copy:
-                return False
+            if value is _MISSING:
+                if strict and is_required:
+                    return False
 
             # If the attribute is provided, validate its type
-            if attr in args_copy and not isinstance(args_copy[attr], type_map.get(attr_type)):
+            elif not isinstance(value, attr_type):
                 return False
 
         # Validate references
-        for ref, info in class_info['references'].items():
-            ref_type = info['type']
-            is_required = info['required']
+        for ref, ref_type, is_required in class_info.ref_validators:
+            value = args.get(ref, _MISSING)
 
             # If the reference is required but not provided, return False
-            if strict and is_required and ref not in args:
-                return False
+            if value is _MISSING:
+                if strict and is_required:
+                    return False
 
             # If the reference is provided, validate its type
-            if ref in args and not self._is_valid_reference(class_name, ref, type(args[ref]).__name__):
+            elif type(value).__name__ != ref_type:
                 return False
 
         return True
@@ -455,21 +604,13 @@ class ModelSpecifications:
         attributes = {}
         references = {}
 
-        # Get the key attribute name for the class
-        key_attribute_name = self.model_objects[class_name]['key']
-
-        # Get attributes and references from the class specification
-        class_attributes = set(attr for attr, _ in self.model_objects[class_name]['attributes'].items())
-        class_references = set(ref for ref, _ in self.model_objects[class_name]['references'].items())
-
-        # If the key attribute name exists in class_attributes and is not 'key', replace it with 'key'
-        if key_attribute_name in class_attributes and key_attribute_name != 'key':
-            class_attributes.remove(key_attribute_name)
-            class_attributes.add('key')
+        # Get attributes (with the key attribute named 'key') and references from the class specification
+        class_info = self._class_info[class_name]
+        class_attributes = class_info.attr_names
+        class_references = class_info.ref_names
 
         # Check for erroneous keys
-        valid_keys = class_attributes.union(class_references)
-        erroneous_keys = set(args.keys()) - valid_keys
+        erroneous_keys = args.keys() - class_info.valid_keys
         if erroneous_keys:
             raise ValueError(f"Invalid keys found: {', '.join(erroneous_keys)}. These are not valid attributes or references for class '{class_name}'.")
 
@@ -492,10 +633,6 @@ class ModelSpecifications:
         Returns:
             List[str]: List of strings summarizing each attribute and reference
         """
-        class_dict = self.model_objects.get(class_name)
-        if not class_dict:
-            return None
-        attr_sum = [f"{key + (' (key)' if data['is_key'] else '')} : {data['type'] + ' (required)' if data['required'] else ' (optional)'}" for key, data in class_dict['attributes'].items()]
-        ref_sum = [f"{key} : {data['type'] + ' (required)' if data['required'] else ' (optional)' } ({data['multiplicity']}){' Inverse: ' + data['inverse'] if data['inverse'] else ''}" for key, data in class_dict['references'].items()]
-        return attr_sum + ref_sum
+        class_info = self._class_info.get(class_name)
+        return class_info.summary if class_info else None
 # endregion
\ No newline at end of file
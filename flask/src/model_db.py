@@ -1,18 +1,158 @@
-import json
 from src.runtime_manager import RuntimeManager, ModuleUnavailableError
 from src.dm_specs import ModelSpecifications
 from neo4j import GraphDatabase
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict, ChainMap
+from contextlib import contextmanager
+from operator import attrgetter
 from typing import List, Tuple, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import threading
+import time
 
 
-create_object_query = "CREATE (n:{class_name}) SET n = $attributes"
+create_object_query = """
+    UNWIND $rows AS row
+    CREATE (a:{class_name}:ModelObject)
+    SET a = row.attrs
+    """
+create_reference_clause = """
+    WITH a, row
+    OPTIONAL MATCH (b:{related_class}) WHERE b.key IN row.refs.{rel_name}
+    WITH a, row, collect(b) AS related
+    FOREACH (b IN related | CREATE (a)-[:{relationship_type}]->(b){inverse_clause})
+    """
+create_links_query = """
+    UNWIND $links AS link
+    MATCH (a:{class_name} {{key: link.key}})
+    MATCH (b:{related_class}) WHERE b.key IN link.related_keys
+    CREATE (a)-[:{relationship_type}]->(b){inverse_clause}
+    """
+update_object_query = """
+    MATCH (a:{class_name} {{key: $key}})
+    SET a += $attrs
+    """
+detach_references_clause = """
+    WITH a
+    OPTIONAL MATCH (a)-[r:{relationship_types}]->()
+    DELETE r
+    WITH DISTINCT a
+    """
+detach_references_with_inverse_clause = """
+    WITH a
+    OPTIONAL MATCH (a)-[r:{relationship_types}]->(b)
+    OPTIONAL MATCH (b)-[r_inv]->(a) WHERE type(r_inv) = CASE type(r){inverse_cases} END
+    DELETE r, r_inv
+    WITH DISTINCT a
+    """
+attach_references_clause = """
+    WITH a, {refs: $refs} AS row
+    """
+merge_object_query = """
+    UNWIND $rows AS row
+    MERGE (a:{class_name}:ModelObject {{key: row.attrs.key}})
+    SET a += row.attrs
+    """
+merge_links_query = """
+    UNWIND $links AS link
+    MATCH (a:{class_name} {{key: link.key}})
+    MATCH (b:{related_class}) WHERE b.key IN link.related_keys
+    MERGE (a)-[:{relationship_type}]->(b){inverse_clause}
+    """
 get_object_query = """
-    MATCH (n:{class_name}) WHERE n.{key_name} = '{key_value}'
+    MATCH (n:{class_name}) WHERE n.{key_name} = $key
     OPTIONAL MATCH (n)-[r]->(related)
     RETURN n, collect(r) as relationships, collect(related) as related_nodes
     """
+load_nodes_query = """
+    UNWIND $keys AS k
+    MATCH (n:{class_name} {{key: k}})
+    OPTIONAL MATCH (n)-[r]->(related:ModelObject)
+    RETURN n AS main_node,
+        collect(CASE WHEN r IS NOT NULL THEN {{relationship_type: type(r), related_node_properties: related}} END) AS relationships
+    """
+load_reduced_nodes_query = """
+    UNWIND $keys AS k
+    MATCH (n:{class_name} {{key: k}})
+    RETURN n AS main_node
+    """
+add_composites_query = """
+    MATCH (parent:{parent_type} {{key: $parent_key}})
+    UNWIND $composites AS attrs
+    CREATE (composite:{composite_type}:Composite)
+    SET composite = attrs
+    CREATE (parent)-[:{collection_name} {{type: 'Collection'}}]->(composite)
+    """
+clone_object_query = """
+    MATCH (src:{class_name} {{key: $key}})
+    CREATE (dst:{class_name}:ModelObject)
+    SET dst = properties(src), dst.key = $new_key
+    """
+clone_reference_clause = """
+    WITH src, dst
+    OPTIONAL MATCH (src)-[:{relationship_type}]->(b:{related_class})
+    WITH src, dst, collect(b) AS related
+    FOREACH (b IN related | CREATE (dst)-[:{relationship_type}]->(b){inverse_clause})
+    """
+clone_return_clause = """
+    WITH dst
+    OPTIONAL MATCH (dst)-[r]->(related:ModelObject)
+    RETURN dst AS main_node,
+        collect(CASE WHEN r IS NOT NULL THEN {relationship_type: type(r), related_node_properties: related} END) AS relationships
+    """
+object_exists_query = "MATCH (n:{class_name} {{key: $key}}) RETURN 1 LIMIT 1"
+delete_object_query = "MATCH (n:{class_name}){index_hint} WHERE n.key = $key DETACH DELETE n"
+objects_exist_query = """
+    UNWIND $keys AS k
+    OPTIONAL MATCH (n:{class_name} {{key: k}})
+    RETURN k, n IS NOT NULL AS found
+    """
+delete_objects_query = """
+    UNWIND $keys AS k
+    MATCH (n:{class_name}){index_hint}
+    WHERE n.key = k
+    DETACH DELETE n
+    """
+# The uniqueness constraint on the key brings an index on it, deletes are pinned to that index by the hint
+key_constraint_query = "CREATE CONSTRAINT constraint_{class_name}_key IF NOT EXISTS FOR (n:{class_name}) REQUIRE n.key IS UNIQUE"
+key_index_hint = " USING INDEX n:{class_name}(key)"
+# Keys found missing in the database are remembered per class for this many seconds, up to this many keys
+miss_cache_ttl = 5.0
+miss_cache_size = 10000
+
+# Placeholder for attributes a (reduced) object doesn't have set
+_missing = object()
+
+# Drivers by (URI, AUTH), shared by every ModelDB setup for the same database, with the number of holders
+_drivers = {}
+_drivers_lock = threading.Lock()
+
+
+def _acquire_driver(URI: str, AUTH: tuple):
+    """
+    Provides the shared driver for the given database, creating it and its connection pool on first use.
+    Every call has to be matched by a call of _release_driver.
+    """
+    with _drivers_lock:
+        entry = _drivers.get((URI, AUTH))
+        if entry is None:
+            driver = GraphDatabase.driver(URI, auth=AUTH, max_connection_pool_size=100, connection_acquisition_timeout=30, keep_alive=True)
+            entry = _drivers[(URI, AUTH)] = [driver, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_driver(URI: str, AUTH: tuple):
+    """
+    Gives up one hold on the shared driver for the given database and closes it once nobody holds it anymore.
+    """
+    with _drivers_lock:
+        entry = _drivers.get((URI, AUTH))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _drivers[(URI, AUTH)]
+            entry[0].close()
 
 
 class ModelDB:
@@ -23,13 +163,38 @@ class ModelDB:
             cls._instance = super(ModelDB, cls).__new__(cls)
         return cls._instance
         
-    def __init__(self, model_specs: ModelSpecifications, runtime_manager: RuntimeManager, URI: str, AUTH: tuple):
+    def __init__(self, model_specs: ModelSpecifications, runtime_manager: RuntimeManager, URI: str, AUTH: tuple, database: str = "neo4j"):
+        # The instance is shared, so a repeated setup hands back the driver of the previous one after taking its own
+        previous_driver = getattr(self, "driver", None) and (self._URI, self._AUTH)
         self._URI = URI
         self._AUTH = AUTH
+        # Naming the database spares the driver a round trip to resolve the default one for every session
+        self._database = database
         self.model_specs = model_specs
         self.runtime = runtime_manager
         self.runtime.set_to_scope("__get_model_object__", self.get_object)
-        self.driver = GraphDatabase.driver(URI, auth=AUTH)
+        self.driver = _acquire_driver(URI, AUTH)
+        # Session and scope depth per thread, see session_scope
+        self._session_local = threading.local()
+        if previous_driver:
+            _release_driver(*previous_driver)
+        # Query texts by shape, values are always bound as parameters. Labels can't be parameters
+        # without losing the label index, so the shape includes the class
+        self._query_cache = {}
+        # Reference details per class, see _get_reference_table
+        self._reference_tables = {}
+        # Getters of the compared values per class, see _objects_match
+        self._match_getters = {}
+        # Keys per class that the database recently didn't have, with the time they were looked up
+        self._miss_cache = defaultdict(OrderedDict)
+        # Specifications and model code the cached queries and tables were built for
+        self._cached_for = (None, None)
+        # Classes whose key is known to be backed by a uniqueness constraint, see create_key_constraints
+        self._key_constraints = set()
+        try:
+            self.create_key_constraints()
+        except Exception as e:
+            print(f"Error creating key constraints: {e}")
 
     @classmethod
     def get_instance(cls):
@@ -47,27 +212,214 @@ class ModelDB:
 
     def close(self):
         """
-        Close the Neo4j database connection.
+        Release the Neo4j database connection. The shared driver is closed once no setup holds it anymore.
         """
-        self.driver.close()
+        if self.driver is not None:
+            _release_driver(self._URI, self._AUTH)
+            self.driver = None
 
 # region Helper functions
 
+    @contextmanager
+    def session_scope(self):
+        """
+        Provides the session of the current thread, opening it when the outermost scope starts and closing it when
+        that scope ends. Nested scopes reuse the open session, so wrapping a whole request lets all its queries share it.
+        """
+        local = self._session_local
+        depth = getattr(local, "depth", 0)
+        if not depth:
+            local.session = self.driver.session(database=self._database)
+        local.depth = depth + 1
+        try:
+            yield local.session
+        finally:
+            local.depth -= 1
+            if not local.depth:
+                session, local.session = local.session, None
+                session.close()
+
+    def _read(self, work, tx=None):
+        """
+        Runs work(tx) in a read transaction and returns its result. If a transaction is passed, it is reused and
+        left to its owner. Otherwise the driver's managed transaction is used, which retries work on transient errors.
+
+        Parameters:
+            work (callable): Function taking the transaction.
+            tx: Optional transaction to reuse.
+        """
+        if tx:
+            return work(tx)
+        return self._run_managed(lambda session, attempt: session.execute_read(attempt), work)
+
+    def _write(self, work, tx=None):
+        """
+        Runs work(tx) in a write transaction and returns its result, see _read.
+        The managed transaction is committed once work returns and rolled back if it raises.
+
+        Parameters:
+            work (callable): Function taking the transaction.
+            tx: Optional transaction to reuse.
+        """
+        if tx:
+            return work(tx)
+        return self._run_managed(lambda session, attempt: session.execute_write(attempt), work)
+
+    def _run_managed(self, execute, work):
+        """
+        Runs work in a managed transaction of the current session. The driver runs work again after transient errors,
+        even after a failed commit, so work must not leave anything behind on the Python side.
+        Register and miss cache changes made by work are therefore staged per attempt and only applied once the
+        transaction has been committed. A retried attempt starts from the state before the first one.
+
+        Parameters:
+            execute (callable): Runs the attempt function in a managed transaction of the given session.
+            work (callable): Function taking the transaction.
+        """
+        local = self._session_local
+
+        def attempt(tx):
+            local.staged_registers = {}
+            local.staged_misses = {}
+            return work(tx), local.staged_registers, local.staged_misses
+
+        try:
+            with self.session_scope() as session:
+                result, staged_registers, staged_misses = execute(session, attempt)
+        finally:
+            local.staged_registers = local.staged_misses = None
+        for class_name, staged in staged_registers.items():
+            self.runtime.get_type_register(class_name).update(staged.maps[0])
+        for (class_name, key), missing in staged_misses.items():
+            if missing:
+                self._remember_missing(class_name, key)
+            else:
+                self._forget_missing(class_name, key)
+        return result
+
     def get_type_register(self, class_name: str):
         """
         Get the type-specific register for a given class name.
+        Within a managed transaction, see _run_managed, objects stored in the returned register are staged.
+        """
+        staged_registers = getattr(self._session_local, "staged_registers", None)
+        if staged_registers is None:
+            return self.runtime.get_type_register(class_name)
+        staged = staged_registers.get(class_name)
+        if staged is None:
+            # Lookups fall through to the register, stores go to the staged layer only
+            staged = staged_registers[class_name] = ChainMap({}, self.runtime.get_type_register(class_name))
+        return staged
+
+    def _sync_caches(self):
+        """
+        Drops the cached query texts, reference tables and match getters once the specifications or the model code have been reloaded.
+        """
+        cached_specs, cached_module = self._cached_for
+        if cached_specs is not self.model_specs.model_objects or cached_module is not self.runtime.loaded_module:
+            self._query_cache.clear()
+            self._reference_tables.clear()
+            self._match_getters.clear()
+            self._miss_cache.clear()
+            self._cached_for = (self.model_specs.model_objects, self.runtime.loaded_module)
+
+    def _is_known_missing(self, class_name: str, key: str) -> bool:
+        """
+        Checks whether the database didn't have the given object when it was looked up within the last miss_cache_ttl seconds.
+        """
+        staged_misses = getattr(self._session_local, "staged_misses", None)
+        if staged_misses and (class_name, key) in staged_misses:
+            return staged_misses[class_name, key]
+        misses = self._miss_cache.get(class_name)
+        missed_at = misses.get(key) if misses else None
+        if missed_at is None:
+            return False
+        if time.monotonic() - missed_at > miss_cache_ttl:
+            del misses[key]
+            return False
+        return True
+
+    def _remember_missing(self, class_name: str, key: str):
         """
-        return self.runtime.get_type_register(class_name)
+        Remembers that the database doesn't have the given object, dropping the oldest entry once miss_cache_size is reached.
+        """
+        staged_misses = getattr(self._session_local, "staged_misses", None)
+        if staged_misses is not None:
+            staged_misses[class_name, key] = True
+            return
+        misses = self._miss_cache[class_name]
+        misses[key] = time.monotonic()
+        misses.move_to_end(key)
+        if len(misses) > miss_cache_size:
+            misses.popitem(last=False)
+
+    def _forget_missing(self, class_name: str, key: str):
+        """
+        Drops the given object from the remembered misses, e.g. because it has just been created.
+        """
+        staged_misses = getattr(self._session_local, "staged_misses", None)
+        if staged_misses is not None:
+            staged_misses[class_name, key] = False
+            return
+        misses = self._miss_cache.get(class_name)
+        if misses:
+            misses.pop(key, None)
+
+    def _get_cached_query(self, cache_key: tuple, build):
+        """
+        Provides the query text for the given shape, building it on first use.
+
+        Parameters:
+            cache_key (tuple): Shape of the query, e.g. ("delete", class_name).
+            build (callable): Builds the query text if it is not cached yet.
+
+        Returns:
+            str: The query text.
+        """
+        self._sync_caches()
+        query = self._query_cache.get(cache_key)
+        if query is None:
+            query = self._query_cache[cache_key] = build()
+        return query
+
+    def _get_reference_table(self, class_name: str) -> dict:
+        """
+        Provides the references of a class as dict of reference name to a tuple of
+        (referenced class name, is multi reference, inverse relationship type or "").
+        """
+        self._sync_caches()
+        table = self._reference_tables.get(class_name)
+        if table is None:
+            inverse_relationships = self.runtime.get_from_scope("INVERSE_RELATIONSHIPS") or {}
+            table = self._reference_tables[class_name] = {
+                rel_name: (
+                    self.model_specs.get_reference_type(class_name, rel_name),
+                    self.model_specs.is_multi_reference(class_name, rel_name),
+                    inverse_relationships.get(rel_name, "").upper()
+                )
+                for rel_name in self.model_specs.get_references(class_name)
+            }
+        return table
+
+    @staticmethod
+    def _to_db_value(value):
+        """
+        Converts a python value to its query parameter representation.
+        Naive datetimes are taken as UTC so they are stored as DateTime rather than LocalDateTime.
+        """
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
 
     def resolve_class_name(self, class_name):
         if not self.runtime.get_status():
             raise ModuleUnavailableError("No model code loaded.")
-        if class_name not in self.model_specs.model_objects:
+        if class_name not in self.model_specs.get_class_names_set():
             raise ValueError(f"Class {class_name} not recognized.")
         return self.runtime.get_attr(class_name)
     
     def wipe_content(self):
-        with self.driver.session() as session:
+        with self.session_scope() as session:
             # Drop constraints and indexes
             try:
                 constraints = session.run("CALL db.constraints").data()
@@ -76,6 +428,7 @@ class ModelDB:
                     session.run(f"DROP CONSTRAINT {constraint['name']}")
                 for index in indexes:
                     session.run(f"DROP INDEX {index['name']}")
+                self._key_constraints.clear()
             except Exception as e:
                 print(f"Error dropping constraints and indexes: {e}")
 
@@ -85,12 +438,36 @@ class ModelDB:
             except Exception as e:
                 print(f"Error deleting nodes and relationships: {e}")
             
+    def create_key_constraints(self):
+        """
+        Ensures a uniqueness constraint on the key of every class. The constraint's index lets lookups by key seek
+        instead of scanning the label, and deletes use it through an index hint.
+        """
+        with self.session_scope() as session:
+            for class_name in self.model_specs.get_class_names_set():
+                query = key_constraint_query.format(class_name=class_name)
+                try:
+                    session.run(query).consume()
+                except Exception as e:
+                    raise ValueError(f"Error creating key constraint for {class_name}. Details: {str(e)}")
+                self._key_constraints.add(class_name)
+
+    def _get_index_hint(self, class_name: str) -> str:
+        """
+        Provides the hint to use the key index of a class, or an empty string while the index isn't known to exist.
+        """
+        return key_index_hint.format(class_name=class_name) if class_name in self._key_constraints else ""
+
     def create_indexes(self):
+        self.create_key_constraints()
         indexes = self.model_specs.get_indexes()
-        with self.driver.session() as session:
+        with self.session_scope() as session:
             for attribute in indexes:
                 type_name = attribute['type_name']
                 attr_name = attribute['attribute_name']
+                # The key is already indexed through its constraint
+                if attribute['entity_type'] == 'ModelObject' and self.model_specs.get_key_attribute(type_name) == attr_name:
+                    continue
                 query = f"CREATE INDEX index_{type_name}_{attr_name} IF NOT EXISTS FOR (n:{type_name}) ON (n.{attr_name})"
                 try:
                     session.run(query)  # Run the query to create the index, no need to check for database changes.
@@ -101,22 +478,30 @@ class ModelDB:
         """
         Check if two objects match in every attribute and reference.
         """
-        attrs = self.model_specs.get_object_attributes(type(obj1).__name__)
-        refs = self.model_specs.get_references(type(obj1).__name__)
-        
-        for attr in attrs:
-            if getattr(obj1, attr) != getattr(obj2, attr):
-                return False
-
-        for ref in refs:
-            if getattr(obj1, ref) != getattr(obj2, ref):
-                return False
-
-        return True
+        class_name = type(obj1).__name__
+        self._sync_caches()
+        getters = self._match_getters.get(class_name)
+        if getters is None:
+            # Fetches all attributes and single references as one tuple, so they compare in a single tuple equality
+            reference_table = self._get_reference_table(class_name)
+            names = self.model_specs.get_object_attributes(class_name) + tuple(ref for ref, (_, is_multi, _) in reference_table.items() if not is_multi)
+            multi_names = tuple(ref for ref, (_, is_multi, _) in reference_table.items() if is_multi)
+            getters = self._match_getters[class_name] = (attrgetter(*names) if names else lambda obj: (), multi_names)
+        getter, multi_names = getters
+        if getter(obj1) != getter(obj2):
+            return False
+
+        # Multi references match if they reference the same keys, regardless of order
+        return all(
+            {item.key for item in getattr(obj1, ref) or ()} == {item.key for item in getattr(obj2, ref) or ()}
+            for ref in multi_names
+        )
     
     def _fetch_references_from_records(self, class_name, records):
         references = {}
-        register_cache = {}  # Cache for object registers
+        reference_table = self._get_reference_table(class_name)
+        # Resolve the register of every referenced class once, instead of per record
+        registers = {rel_class_name: self.get_type_register(rel_class_name) for rel_class_name, _, _ in reference_table.values()}
 
         for record in records:
             relationship = record.get('relationship_type')
@@ -125,107 +510,146 @@ class ModelDB:
                 continue
             
             relationship = relationship.lower()
-            rel_class_name = self.model_specs.get_reference_type(class_name, relationship)
-            if rel_class_name not in register_cache:
-                register_cache[rel_class_name] = self.get_type_register(rel_class_name)
+            rel_class_name, is_multi, _ = reference_table[relationship]
+            register = registers[rel_class_name]
+            rel_key = rel_node['key']
             
-            related_obj = register_cache[rel_class_name].get(rel_node['key'])
+            related_obj = register.get(rel_key)
             if not related_obj:
-                related_class = self.resolve_class_name(rel_class_name)
-                related_obj = related_class.create_reduced(rel_node['key'])
-                register_cache[rel_class_name][rel_node['key']] = related_obj
+                related_obj = register[rel_key] = self.resolve_class_name(rel_class_name).create_reduced(rel_key)
             
-            if self.model_specs.is_multi_reference(class_name, relationship):
+            if is_multi:
                 references.setdefault(relationship, []).append(related_obj)
             else:
                 references[relationship] = related_obj
 
         return references
 
-    def _construct_create_query(self, class_name, attrs, refs):
-        node_attrs_list = []
-        for k, v in attrs.items():
-            if isinstance(v, datetime):
-                formatted_datetime = v.isoformat()
-                node_attr = f'{k}: datetime("{formatted_datetime}")'
-            else:
-                node_attr = f"{k}: {json.dumps(v)}"
-            node_attrs_list.append(node_attr)
+    def _get_create_query(self, class_name):
+        """
+        Provides the creation query of a class. Nodes are passed as $rows, each holding the node's attributes
+        and a list of referenced keys per reference. The query text only depends on the class, so it is built
+        once and the database can reuse its plan.
+        """
+        def build():
+            clauses = [create_object_query.format(class_name=class_name)]
+            clauses.extend(self._get_reference_clause(class_name, rel_name) for rel_name in self._get_reference_table(class_name))
+            return "".join(clauses)
+
+        return self._get_cached_query(("create", class_name), build)
+
+    def _get_reference_clause(self, class_name, rel_name):
+        """
+        Provides the clause linking node a to the nodes whose keys are listed in row.refs.<rel_name>,
+        shared by the creation and update queries.
+        """
+        def build():
+            related_class, _, inv_rel_type = self._get_reference_table(class_name)[rel_name]
+            return create_reference_clause.format(
+                related_class=related_class,
+                rel_name=rel_name,
+                relationship_type=rel_name.upper(),
+                inverse_clause=f" CREATE (b)-[:{inv_rel_type}]->(a)" if inv_rel_type else ""
+            )
+
+        return self._get_cached_query(("reference_clause", class_name, rel_name), build)
+
+    def _get_create_links_query(self, class_name, rel_name, merge=False):
+        """
+        Provides the query linking already created nodes of a class along one reference. Links are passed as
+        $links, each holding the key of the node and the list of referenced keys.
+        With merge, relationships that already exist are kept instead of being created a second time.
+        """
+        def build():
+            related_class, _, inv_rel_type = self._get_reference_table(class_name)[rel_name]
+            template, operation = (merge_links_query, "MERGE") if merge else (create_links_query, "CREATE")
+            return template.format(
+                class_name=class_name,
+                related_class=related_class,
+                relationship_type=rel_name.upper(),
+                inverse_clause=f" {operation} (b)-[:{inv_rel_type}]->(a)" if inv_rel_type else ""
+            )
+
+        return self._get_cached_query(("links", class_name, rel_name, merge), build)
 
-        node_attrs = ", ".join(node_attrs_list)
-        query = [f"CREATE (a:{class_name}:ModelObject {{ {node_attrs} }})"]
+    @staticmethod
+    def _related_keys(rel_data) -> list:
+        """
+        Provides the keys referenced by a reference value. Multi references come as list, single references as object
+        or as dict with the key. Each key is listed once, so each referenced node gets linked once.
+        """
+        if isinstance(rel_data, list):
+            related_keys = [item.key for item in rel_data]
+        elif isinstance(rel_data, dict):
+            related_keys = [rel_data['key']]
+        elif rel_data is not None:
+            related_keys = [rel_data.key]
+        else:
+            related_keys = []
+        return list(dict.fromkeys(related_keys))
+
+    def _construct_create_row(self, class_name, attrs, refs):
+        """
+        Builds the parameter row of a single node for the creation query.
+
+        Returns:
+            Tuple[dict, int]: The row and the number of relationships its creation is expected to add.
+        """
+        reference_table = self._get_reference_table(class_name)
+        row_refs = {rel_name: [] for rel_name in reference_table}
         expected_rel_created = 0
 
-        if any(ref_data for ref_data in refs.values()):
-            for rel_name, rel_data in refs.items():
-                relationship_type = rel_name.upper()
-                inv_rel_type = self.runtime.get_from_scope("INVERSE_RELATIONSHIPS").get(rel_name, "").upper()
-
-                # Check if rel_data is a list (indicating multi-reference)
-                if isinstance(rel_data, list):
-                    for item in rel_data:
-                        related_class_name = type(item).__name__
-                        related_key = item.key
-                        query.append("WITH a")
-                        query.append(f"MATCH (b_{rel_name}:{related_class_name} {{key: '{related_key}'}})")
-                        query.append(f"CREATE (a)-[:{relationship_type}]->(b_{rel_name})")
-                        expected_rel_created += 1
-                        if inv_rel_type:
-                            query.append(f"CREATE (b_{rel_name})-[:{inv_rel_type}]->(a)")
-                            expected_rel_created += 1
-
-                else:  # Single reference
-                    if isinstance(rel_data, dict):
-                        related_class_name = rel_data['class_name']
-                        related_key = rel_data['key']
-                    else:  # It's an object
-                        related_class_name = type(rel_data).__name__
-                        related_key = rel_data.key
-
-                    query.append("WITH a")
-                    query.append(f"MATCH (b_{rel_name}:{related_class_name} {{key: '{related_key}'}})")
-                    query.append(f"CREATE (a)-[:{relationship_type}]->(b_{rel_name})")
-                    expected_rel_created += 1
-                    if inv_rel_type:
-                        query.append(f"CREATE (b_{rel_name})-[:{inv_rel_type}]->(a)")
-                        expected_rel_created += 1
-
-        return "\n".join(query), expected_rel_created
-    
-    def _construct_update_node_query(self, class_name, key, attrs):
-        set_clause = ", ".join(f"n.{attr_name} = ${attr_name}" for attr_name in attrs.keys())
-        query = f"""
-        MATCH (n:{class_name})
-        WHERE n.key = $key
-        SET {set_clause}
-        """
-        query_params = {"key": key, **attrs}
-        return query, query_params
+        for rel_name, rel_data in refs.items():
+            related_keys = row_refs[rel_name] = self._related_keys(rel_data)
+            expected_rel_created += len(related_keys) * (2 if reference_table[rel_name][2] else 1)
 
-    def _construct_update_relationships_query(self, class_name, key, refs):
-        detach_queries = []
-        attach_queries = []
-        for rel_name, rel_object in refs.items():
-            relationship_type = rel_name.upper()
-            related_class_name = type(rel_object).__name__
-            inv_rel_type = self.runtime.get_from_scope("INVERSE_RELATIONSHIPS").get(rel_name, "").upper()
-
-            detach_queries.append(f"""
-            MATCH (a:{class_name} {{key: '{key}'}})-[r:{relationship_type}]->(b)
-            DELETE r""")
-            if inv_rel_type:
-                detach_queries.append(f"""
-                OPTIONAL MATCH (b)-[r_inv:{inv_rel_type}]->(a) DELETE r_inv""")
-            
-            attach_queries.append(f"""
-            MATCH (a:{class_name} {{key: '{key}'}})
-            MATCH (b:{related_class_name} {{key: '{rel_object.key}'}})
-            MERGE (a)-[:{relationship_type}]->(b)""")
-            if inv_rel_type:
-                attach_queries.append(f"""
-                MERGE (b)-[:{inv_rel_type}]->(a)""")
+        row = {
+            "attrs": {attr_name: self._to_db_value(value) for attr_name, value in attrs.items()},
+            "refs": row_refs
+        }
+        return row, expected_rel_created
+
+    def _construct_create_query(self, class_name, attrs, refs):
+        row, expected_rel_created = self._construct_create_row(class_name, attrs, refs)
+        return self._get_create_query(class_name), {"rows": [row]}, expected_rel_created
+    
+    def _construct_update_query(self, class_name, key, attrs, refs):
+        """
+        Builds the query updating a node's attributes and replacing its relationships for the given references
+        in a single statement. The query text only depends on the class and the updated reference names.
 
-        return "\n".join(detach_queries), "\n".join(attach_queries)
+        Returns:
+            Tuple[str, dict]: The query and its parameters.
+        """
+        ref_names = tuple(refs)
+
+        def build():
+            query = update_object_query.format(class_name=class_name)
+            if not ref_names:
+                return query
+
+            reference_table = self._get_reference_table(class_name)
+            relationship_types = "|".join(rel_name.upper() for rel_name in ref_names)
+            # Only the inverse edges coming back from the current targets of each relationship are removed
+            inverse_cases = "".join(
+                f" WHEN '{rel_name.upper()}' THEN '{reference_table[rel_name][2]}'"
+                for rel_name in ref_names if reference_table[rel_name][2]
+            )
+            if inverse_cases:
+                clauses = [query, detach_references_with_inverse_clause.format(relationship_types=relationship_types, inverse_cases=inverse_cases)]
+            else:
+                clauses = [query, detach_references_clause.format(relationship_types=relationship_types)]
+            clauses.append(attach_references_clause)
+            clauses.extend(self._get_reference_clause(class_name, rel_name) for rel_name in ref_names)
+            return "".join(clauses)
+
+        query = self._get_cached_query(("update", class_name, ref_names), build)
+        query_params = {
+            "key": key,
+            "attrs": {attr_name: self._to_db_value(value) for attr_name, value in attrs.items()},
+            "refs": {rel_name: self._related_keys(rel_data) for rel_name, rel_data in refs.items()}
+        }
+        return query, query_params
 
     @staticmethod
     def _fetch_database_stats(tx):
@@ -249,8 +673,8 @@ class ModelDB:
         }
 
     def get_stats(self):
-        with self.driver.session() as session:
-            return session.read_transaction(self._fetch_database_stats)
+        with self.session_scope() as session:
+            return session.execute_read(self._fetch_database_stats)
 
     def object_from_node(self, class_name, node, records=None, reduced_object=None):
         """
@@ -265,34 +689,50 @@ class ModelDB:
         Returns:
             The corresponding Python object.
         """
-        if reduced_object:
-            obj_class = type(reduced_object)
-            assert class_name == obj_class.__name__
-        else:
-            obj_class = self.resolve_class_name(class_name)
         key = node['key']
-        custom_key = self.model_specs.get_key_attribute(class_name)
-
         register = self.get_type_register(class_name)
-        obj = register.get(key, None)
-        if reduced_object and obj:
-            assert reduced_object == obj, f"Found two different objects for class {class_name} with key {key}. This should not happen."
+        skipped_keys = {"key", self.model_specs.get_key_attribute(class_name)}
+
+        obj = register.get(key)
+        if reduced_object:
+            assert class_name == type(reduced_object).__name__
+            if obj:
+                assert reduced_object == obj, f"Found two different objects for class {class_name} with key {key}. This should not happen."
         if obj:
             reduced_object = obj
         # Extract attributes and references from the records
-        attributes = {key: node[key] for key in node if key != "key" and key != custom_key}
+        attributes = {name: value for name, value in node.items() if name not in skipped_keys}
         references = self._fetch_references_from_records(class_name, records) if records else {}
 
         if reduced_object:
             if not reduced_object.mini_mode:
                 reduced_object._mini_mode = True
             reduced_object.upgrade(**attributes, **references)
-            register[key] = reduced_object
+            # Objects that came from the register are already stored under their key
+            if obj is not reduced_object:
+                register[key] = reduced_object
             return reduced_object
-        new_obj = obj_class(key=key, **attributes, **references)
+        new_obj = self.resolve_class_name(class_name)(key=key, **attributes, **references)
         register[key] = new_obj
         return new_obj
     
+    def _exists(self, class_name: str, key: str, tx) -> bool:
+        """
+        Checks whether an object exists, either in the register or in the database, without loading it.
+
+        Parameters:
+            class_name (str): The class name of the object.
+            key (str): The key to identify the object.
+            tx: The active transaction.
+
+        Returns:
+            bool: True if the object exists, False otherwise.
+        """
+        if key in self.get_type_register(class_name):
+            return True
+        query = self._get_cached_query(("exists", class_name), lambda: object_exists_query.format(class_name=class_name))
+        return tx.run(query, key=key).single() is not None
+
     def load_node(self, class_name: str, key: str, tx, reduced=False, reduced_object=None):
         """
         Fetches the node from the database and returns its corresponding Python object.
@@ -306,21 +746,27 @@ class ModelDB:
         Returns:
             The corresponding Python object or None if not found.
         """
-        # Base query to retrieve the node
-        query = f"MATCH (n:{class_name}) WHERE n.key = $key "
-
-        # If related nodes and relationships are to be included, modify the query
-        if not reduced:
-            query += """
-            OPTIONAL MATCH (n)-[r]->(related:ModelObject)
-            RETURN 
-                n as main_node,
-                type(r) as relationship_type, 
-                related as related_node_properties
-            """
+        def build():
+            # Base query to retrieve the node
+            query = f"MATCH (n:{class_name}) WHERE n.key = $key "
+
+            # If related nodes and relationships are to be included, modify the query
+            if not reduced:
+                query += """
+                OPTIONAL MATCH (n)-[r]->(related:ModelObject)
+                RETURN 
+                    n as main_node,
+                    type(r) as relationship_type, 
+                    related as related_node_properties
+                """
+            else:
+                query += "RETURN n as main_node"
+            return query
+
+        query = self._get_cached_query(("load", class_name, bool(reduced)), build)
         try:
-            result = tx.run(query, key=key)
-            records = result.data()
+            # Keep the driver records, they expose the nodes as mappings without copying them into dicts
+            records = list(tx.run(query, key=key))
             
             if not records:
                 return None
@@ -336,7 +782,7 @@ class ModelDB:
 
 # region CRUD related
 
-    def get_object(self, class_name: str, key: str, reduced=False):
+    def get_object(self, class_name: str, key: str, reduced=False, tx=None):
         """
         Finds an object of type class_name with the specified key.
         It first checks in the already loaded objects, then queries the database.
@@ -346,6 +792,7 @@ class ModelDB:
             class_name (str): name of the object class
             key (str): value of key attribute of object to be identified by
             reduced (bool): Whether to load the object in mini_mode or fully.
+            tx: Optional transaction to run the database query.
             
         Returns:
             Object of type class_name if it exists, None otherwise
@@ -358,11 +805,13 @@ class ModelDB:
         # If an object was found and it's in full mode or only reduced mode is required
         if obj and (not obj.mini_mode or reduced):
             return obj
+        # Skip the database if it recently didn't have the object
+        if not obj and self._is_known_missing(class_name, key):
+            return None
         # Fetch the object data from the database because we have nothing loaded and need to know, if the object even exists
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            obj = self.load_node(class_name, key, tx, reduced)
-            tx.commit()
+        obj = self._read(lambda tx: self.load_node(class_name, key, tx, reduced), tx)
+        if obj is None:
+            self._remember_missing(class_name, key)
         return obj
 
     def get_multiple_objects(self, class_key_pairs: List[Tuple[str, str]], reduced=False) -> List[Any]:
@@ -376,95 +825,139 @@ class ModelDB:
         Returns:
             list: A list of objects corresponding to the class and key pairs.
         """
-        objects = []
-        # Group by class_name for more efficient querying
-        grouped_pairs = defaultdict(list)
-        for class_name, key in class_key_pairs:
-            grouped_pairs[class_name].append(key)
-
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            for class_name, keys in grouped_pairs.items():
-                register = self.get_type_register(class_name)
-                for key in keys:
-                    # check register if the object is already loaded
-                    obj = register.get(key)
-                    # If an object was found and it's in full mode or only reduced mode is required
-                    if obj and (not obj.mini_mode or reduced):
-                        objects.append(obj)
-                        continue
-                    obj = self.load_node(class_name, key, tx, reduced_object=obj, include_related=not reduced)
-                    # add the result to return list if an object was found
-                    if obj:
-                        objects.append(obj)
-            tx.commit()
-
-        return objects
+        found = {}  # Objects by (class_name, key)
+        registers = {}  # Type registers by class_name
+        # Keys to load from the database, grouped by class_name for more efficient querying
+        missing_keys = defaultdict(list)
+
+        # Probe the register once per distinct pair. Only reduced objects are upgraded if full mode is required
+        for pair in dict.fromkeys(class_key_pairs):
+            class_name, key = pair
+            register = registers.get(class_name)
+            if register is None:
+                register = registers[class_name] = self.get_type_register(class_name)
+            obj = register.get(key)
+            if obj and (not obj.mini_mode or reduced):
+                found[pair] = obj
+            else:
+                missing_keys[class_name].append(key)
+
+        def work(tx):
+            # Load all missing objects of a class with a single query
+            for class_name, keys in missing_keys.items():
+                register = registers[class_name]
+                if reduced:
+                    query = self._get_cached_query(("load_many", class_name, True), lambda: load_reduced_nodes_query.format(class_name=class_name))
+                else:
+                    query = self._get_cached_query(("load_many", class_name, False), lambda: load_nodes_query.format(class_name=class_name))
+                for record in tx.run(query, keys=keys):
+                    node = record['main_node']
+                    key = node['key']
+                    found[class_name, key] = self.object_from_node(class_name, node, None if reduced else record['relationships'], register.get(key))
+
+        if missing_keys:
+            self._read(work)
+
+        # add the results to return list in input order if an object was found
+        return [found[pair] for pair in class_key_pairs if pair in found]
     
-    def find_objects(self, class_name, args, reduced=False): # TODO: Test
+    def _construct_find_query(self, class_name, args, reduced):
         """
-        Finds objects of type class_name based on provided properties.
-        
-        Parameters:
-            class_name (str): The class name of the objects to find.
-            args (dict): Dictionary of properties and references to use for filtering.
-            reduced (bool): Whether to load the object in reduced mode or fully.
-            
+        Builds the query finding the nodes of type class_name that match the given properties and references.
+        Unless reduced, each node comes with its outgoing relationships, so no further query is needed per node.
+
         Returns:
-            List of objects matching the criteria.
+            Tuple[str, dict]: The query and its parameters.
         """
         # Validate args
         valid_attributes = self.model_specs.get_object_attributes(class_name, indiv_key=False)
-        valid_references = self.model_specs.get_references(class_name)
+        valid_references = self._get_reference_table(class_name)
         property_filters = []
         relationship_filters = []
+        query_params = {}
 
         for key, value in args.items():
             if key in valid_attributes:
-                property_filters.append(f"n.{key} = {value}")
+                property_filters.append(f"n.{key} = $attr_{key}")
+                query_params[f"attr_{key}"] = self._to_db_value(value)
             elif key in valid_references:
                 if isinstance(value, str):  # If value is a key string
                     relationship_key = value
                 else:  # If value is an object
                     relationship_key = value.key
-                related_class = self.model_specs.get_reference_type(class_name, key)
+                related_class = valid_references[key][0]
                 relationship_name = key.upper()
-                relationship_filters.append(f"(n)-[:{relationship_name}]->(:{related_class} {{key: '{relationship_key}'}})")
+                relationship_filters.append(f"(n)-[:{relationship_name}]->(:{related_class} {{key: $ref_{key}}})")
+                query_params[f"ref_{key}"] = relationship_key
 
         # Construct the Cypher query
-        filters = property_filters + relationship_filters
-        query_filter = " AND ".join(filters)
-        query = f"""
-        MATCH (n:{class_name})
-        WHERE {query_filter}
-        RETURN n
+        def build():
+            filters = property_filters + relationship_filters
+            query_filter = f"WHERE {' AND '.join(filters)}" if filters else ""
+            if reduced:
+                query_return = "RETURN n"
+            else:
+                query_return = """OPTIONAL MATCH (n)-[r]->(related:ModelObject)
+            RETURN n,
+                collect(CASE WHEN r IS NOT NULL THEN {relationship_type: type(r), related_node_properties: related} END) AS relationships"""
+            return f"""
+            MATCH (n:{class_name})
+            {query_filter}
+            {query_return}
+            """
+
+        query = self._get_cached_query(("find", class_name, tuple(query_params), bool(reduced)), build)
+        return query, query_params
+
+    def _objects_from_find_result(self, class_name, result, reduced):
+        """
+        Yields the objects for the records of a find query, see _construct_find_query.
+        Objects already loaded in the required mode are taken from the register.
         """
+        register_get = self.get_type_register(class_name).get
+        for record in result:
+            node = record['n']
+            obj = register_get(node['key'])
 
-        nodes_to_process = []
+            # Check register and handle object
+            if not obj or (obj.mini_mode and not reduced):
+                obj = self.object_from_node(class_name, node, None if reduced else record['relationships'], obj)
+            yield obj
 
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            results = tx.run(query)
-            
-            # Gather nodes to process outside the session
-            nodes_to_process = [record['n'] for record in results]
-            objects_found = []
-
-            for node in nodes_to_process:
-                key = node['key']
-                register = self.get_type_register(class_name)
-                obj = register.get(key, None)
-
-                # Check register and handle object
-                if not obj or (obj and obj.mini_mode and not reduced):
-                    obj = self.load_node(class_name, key, tx, reduced=reduced, reduced_object=obj)
-                elif reduced and not obj:
-                    obj = self.object_from_node(node, reduced=True)
-                
-                objects_found.append(obj)
-            tx.commit()
+    def find_objects(self, class_name, args, reduced=False, tx=None): # TODO: Test
+        """
+        Finds objects of type class_name based on provided properties.
         
-        return objects_found
+        Parameters:
+            class_name (str): The class name of the objects to find.
+            args (dict): Dictionary of properties and references to use for filtering.
+            reduced (bool): Whether to load the object in reduced mode or fully.
+            tx: Optional transaction to run the database queries.
+            
+        Returns:
+            List of objects matching the criteria.
+        """
+        query, query_params = self._construct_find_query(class_name, args, reduced)
+        return self._read(lambda tx: list(self._objects_from_find_result(class_name, tx.run(query, query_params), reduced)), tx)
+
+    def find_objects_stream(self, class_name, args, reduced=False):
+        """
+        Finds objects of type class_name based on provided properties, like find_objects, but yields each object as
+        soon as its record arrives instead of collecting all of them first.
+        The session and transaction stay open until the generator is exhausted or closed.
+
+        Parameters:
+            class_name (str): The class name of the objects to find.
+            args (dict): Dictionary of properties and references to use for filtering.
+            reduced (bool): Whether to load the object in reduced mode or fully.
+
+        Yields:
+            Objects matching the criteria.
+        """
+        query, query_params = self._construct_find_query(class_name, args, reduced)
+        with self.session_scope() as session:
+            with session.begin_transaction() as tx:
+                yield from self._objects_from_find_result(class_name, tx.run(query, query_params), reduced)
 
     def create_object(self, class_name: str, args: dict, tx=None): # TODO: Test
         """
@@ -488,7 +981,7 @@ class ModelDB:
         if not key_value:
             raise ValueError(f'Key attribute {key_name} not provided in arguments.')
 
-        existing_object = self.get_object(class_name, key_value)
+        existing_object = self.get_object(class_name, key_value, tx=tx)
         if existing_object:
             return existing_object
 
@@ -504,53 +997,94 @@ class ModelDB:
         attrs, refs = self.model_specs.separate_attrs_refs(class_name, args)
 
         # Construct the creation query
-        query_create, expected_rel_created = self._construct_create_query(class_name, attrs, refs)
+        query_create, query_params, expected_rel_created = self._construct_create_query(class_name, attrs, refs)
         
         # -- Run Query on Database and handle results --
         # Execute the query and handle results
-        def execute_query(transaction):
-            counters = transaction.run(query_create).consume().counters
+        def work(transaction):
+            counters = transaction.run(query_create, query_params).consume().counters
             if (counters.nodes_created != 1) or (counters.relationships_created != expected_rel_created):
                 raise ValueError(f"Error creating node or relationships in Neo4j. Expected 1 node and {expected_rel_created} relationships but got {counters.nodes_created} nodes and {counters.relationships_created} relationships.")
 
-        if tx:
-            execute_query(tx)
-        else:
-            with self.driver.session() as session:
-                session.write_transaction(execute_query)
+        self._write(work, tx)
                 
         # Store the object in the register
         register[obj.key] = obj
+        self._forget_missing(class_name, obj.key)
 
         return obj
     
-    def create_multiple_objects(self, objects_to_create: List[Tuple[str, dict]]): # TODO: Test
+    def create_multiple_objects(self, objects_to_create: List[Tuple[str, dict]], tx=None): # TODO: Test
         """
         Creates multiple new objects. If an object with the same key already exists, returns that object.
         Otherwise, creates a new one according to the provided parameters.
 
         Parameters:
             objects_to_create (list): List of tuples. Each tuple consists of class_name (str) and args (dict).
+            tx: Optional transaction to run the database queries.
 
         Returns:
             List of objects created or fetched.
         """
         created_objects = []
+        new_objects = {}  # Objects created by this call by (class_name, key)
+        grouped_rows = defaultdict(list)  # Node rows by class_name
+        expected_rel_created = 0
 
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            try:
-                for class_name, args in objects_to_create:
-                    obj = self.create_object(class_name, args, tx=tx)
-                    created_objects.append(obj)
-                tx.commit()
-            except:
-                tx.rollback()
-                raise
+        # -- Validate parameters, check for target objects in register and prepare rows --
+        for class_name, args in objects_to_create:
+            target_class = self.resolve_class_name(class_name)
+            key_name = self.model_specs.get_key_attribute(class_name)
+
+            key_value = args.get('key', args.get(key_name))
+            if not key_value:
+                raise ValueError(f'Key attribute {key_name} not provided in arguments.')
+
+            existing_object = new_objects.get((class_name, key_value)) or self.get_object(class_name, key_value, tx=tx)
+            if existing_object:
+                created_objects.append(existing_object)
+                continue
+
+            if not self.model_specs.validate_arguments(class_name, args):
+                raise ValueError(f'Invalid Constructor Arguments for class {class_name}: {str(args)}')
+
+            # Rename custom key name to 'key' and instantiate the object
+            args['key'] = args.pop(key_name, key_value)
+            obj = target_class(**args)
+            attrs, refs = self.model_specs.separate_attrs_refs(class_name, args)
+
+            row, row_rel_created = self._construct_create_row(class_name, attrs, refs)
+            grouped_rows[class_name].append(row)
+            expected_rel_created += row_rel_created
+            new_objects[class_name, key_value] = obj
+            created_objects.append(obj)
+
+        # -- Run Queries on Database: all nodes first, so references among the new objects resolve --
+        def work(tx):
+            nodes_created = 0
+            relationships_created = 0
+            for class_name, rows in grouped_rows.items():
+                query = self._get_cached_query(("create_nodes", class_name), lambda: create_object_query.format(class_name=class_name))
+                nodes_created += tx.run(query, rows=rows).consume().counters.nodes_created
+            for class_name, rows in grouped_rows.items():
+                for rel_name in self.model_specs.get_references(class_name):
+                    links = [{"key": row["attrs"]["key"], "related_keys": row["refs"][rel_name]} for row in rows if row["refs"][rel_name]]
+                    if links:
+                        query = self._get_create_links_query(class_name, rel_name)
+                        relationships_created += tx.run(query, links=links).consume().counters.relationships_created
+            if (nodes_created != len(new_objects)) or (relationships_created != expected_rel_created):
+                raise ValueError(f"Error creating nodes or relationships in Neo4j. Expected {len(new_objects)} nodes and {expected_rel_created} relationships but got {nodes_created} nodes and {relationships_created} relationships.")
+
+        self._write(work, tx)
+
+        # Store the objects in the register
+        for (class_name, _), obj in new_objects.items():
+            self.get_type_register(class_name)[obj.key] = obj
+            self._forget_missing(class_name, obj.key)
 
         return created_objects
 
-    def update_object(self, class_name: str, key: str, args: dict):
+    def update_object(self, class_name: str, key: str, args: dict, tx=None):
         """
         Updates an existing object of type class_name identified by the key.
         Updates both the object's representation in the program and in the database.
@@ -559,13 +1093,14 @@ class ModelDB:
             class_name (str): The name of the object class.
             key (str): The key to identify the object.
             args (dict): Dictionary of attributes and relationships to update.
+            tx: Optional transaction to run the database queries.
 
         Returns:
             The updated object or an appropriate result/error message.
         """
         # 1. Preparations
         # Object Lookup
-        obj = self.get_object(class_name, key)
+        obj = self.get_object(class_name, key, tx=tx)
         if not obj:
             raise ValueError(f"No object of type {class_name} with key {key} found.")
         # Check if trying to update the key
@@ -577,21 +1112,13 @@ class ModelDB:
             raise ValueError(f'Invalid Update Arguments for class {class_name}: {str(args)}')
         # Separate attributes from references and prepare queries
         attrs, refs = self.model_specs.separate_attrs_refs(class_name, args)
-        query, query_params = self._construct_update_node_query(class_name, key, attrs)
-        detach_query, attach_query = self._construct_update_relationships_query(class_name, key, refs)
+        query, query_params = self._construct_update_query(class_name, key, attrs, refs)
 
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            try:
-                # 2. Update Database
-                tx.run(query, query_params)
-                tx.run(detach_query)
-                tx.run(attach_query)
-                
-                tx.commit()
-            except Exception as e:
-                tx.rollback()
-                raise RuntimeError(f"Failed to update object of type {class_name} with key {key}. Reason: {str(e)}")
+        try:
+            # 2. Update Database
+            self._write(lambda tx: tx.run(query, query_params).consume(), tx)
+        except Exception as e:
+            raise RuntimeError(f"Failed to update object of type {class_name} with key {key}. Reason: {str(e)}")
 
         # 3. Update Python Object
         # Update attributes
@@ -604,97 +1131,159 @@ class ModelDB:
         # 4. Return the updated object
         return obj
 
-    def add_object(self, obj_instance, tx=None) -> bool:
+    def _plan_add(self, obj_instances, tx):
         """
-        Synchronizes a given program object instance to the database.
-        If an object with the same key already exists in the database, it updates the existing object.
-        If not, it creates a new object in the database.
+        Collects the objects that have to be written to the database to add the given instances.
+        References to objects that don't exist yet are followed breadth first, and every object is visited once
+        no matter how many others reference it.
 
         Parameters:
-            obj_instance: An instance of a model object.
-            tx: Optional transaction to run the database query.
+            obj_instances (list): Instances of model objects to add.
+            tx: The active transaction.
 
         Returns:
-            bool: True if the operation succeeded, False otherwise.
+            Tuple[list, int]: The objects to write in discovery order and how many of them are new to the database.
         """
-        
-        def core_logic(transaction):
-            def prepare_reference(ref_name, ref_value):
-                """
-                Helper function to process a reference (either mono or multi).
-                Returns True if successful, False otherwise.
-                """
-                # Handle multi-references
-                if isinstance(ref_value, list):
-                    for item in ref_value:
-                        prepare_single_reference(ref_name, item)
-                # Handle mono-references
-                else:
-                    prepare_single_reference(ref_name, ref_value)
-
-            def prepare_single_reference(ref_name, ref_instance):
-                """
-                Helper function to process a single reference.
-                Returns True if successful, False otherwise.
-                """
-                ref_class_name = type(ref_instance).__name__
-                if ref_class_name not in self.model_specs.get_class_names():
-                    raise ValueError(f"Invalid object type in reference for {ref_name}.")
-                ref_obj = self.get_object(ref_class_name, ref_instance.key)
-                if not ref_obj:
-                    # Check for inverse relationships
-                    inverse_rel = self.loaded_module.INVERSE_RELATIONSHIPS.get(ref_name, "")
-                    if inverse_rel:
-                        # Alert the caller
-                        raise ValueError(f"Inverse relationship found for {ref_name}. Can't handle this for now.")
-                    # If the referenced object doesn't exist, add it recursively
-                    try:
-                        self.add_object(ref_instance, transaction)
-                    except Exception as e:
-                        raise ReferenceError(f"Failed to make sure required referenced object {str(ref_instance)} exists because of:\r\n{e}\r\nAborting...")
+        class_names = self.model_specs.get_class_names_set()
+        planned = []
+        new_count = 0
+        visited = set()
+        # Pairs of object and the name of the reference it was found through, None for the given instances
+        worklist = deque((obj_instance, None) for obj_instance in obj_instances)
+
+        while worklist:
+            obj_instance, ref_name = worklist.popleft()
             class_name = type(obj_instance).__name__
-            
+
             # Validate if the instance is of a recognized model object type
-            if class_name not in self.model_specs.get_class_names():
-                raise ValueError(f"Add object call on wrong object type. Needs to be representing a valid model object class.")
-            
-            key_name = self.model_specs.get_key_attribute(class_name)
-            key_value = obj_instance.key
-        
-            # Check for existing object in the database by key
-            existing_object = self.get_object(class_name, key_value)
-            if existing_object:
-                if self._objects_match(obj_instance, existing_object):
-                    return True
-        
-            # Compile arguments for object creation. Start with references
-            args = {ref: getattr(obj_instance, ref) for ref in self.model_specs.get_references(class_name) if hasattr(obj_instance, ref)}
-            
-            # Handle references and ensure they exist in the database
-            for ref, value in args.items():
-                prepare_reference(ref, value)
-            
-            # also add attributes
-            args.update({attr: getattr(obj_instance, attr) for attr in self.model_specs.get_object_attributes(class_name, indiv_key=False) if hasattr(obj_instance, attr)})
+            if class_name not in class_names:
+                if ref_name is None:
+                    raise ValueError(f"Add object call on wrong object type. Needs to be representing a valid model object class.")
+                raise ValueError(f"Invalid object type in reference for {ref_name}.")
+            if (class_name, obj_instance.key) in visited:
+                continue
+            visited.add((class_name, obj_instance.key))
+
+            # Referenced objects that exist are left as they are, given instances are written if they differ
+            if ref_name is not None:
+                if self._exists(class_name, obj_instance.key, tx):
+                    continue
+                new_count += 1
+            else:
+                existing_object = self.get_object(class_name, obj_instance.key, tx=tx)
+                if not existing_object:
+                    new_count += 1
+                elif self._objects_match(obj_instance, existing_object):
+                    continue
+            planned.append(obj_instance)
+
+            for ref in self.model_specs.get_references(class_name):
+                ref_value = getattr(obj_instance, ref, None)
+                if isinstance(ref_value, list):
+                    worklist.extend((item, ref) for item in ref_value)
+                elif ref_value is not None:
+                    worklist.append((ref_value, ref))
+
+        return planned, new_count
 
-            # Construct the creation query
+    def _add_objects(self, obj_instances, tx):
+        """
+        Synchronizes the given instances and the objects they reference to the database within the given transaction.
+        All nodes are merged per class first, then the relationships per class and reference, so the order
+        the objects reference each other in doesn't matter.
+
+        Parameters:
+            obj_instances (list): Instances of model objects to add.
+            tx: The active transaction.
+        """
+        planned, new_count = self._plan_add(obj_instances, tx)
+        if not planned:
+            return
+        grouped_rows, planned_refs = self._prepare_add_rows(planned)
+        self._run_add_queries(tx.run, grouped_rows, new_count)
+        self._finish_add(planned_refs, tx)
+
+    def _prepare_add_rows(self, planned):
+        """
+        Builds one parameter row per planned object, grouped by class.
+
+        Returns:
+            Tuple[dict, list]: The rows by class name and a list of (object, class name, references) per planned object.
+        """
+        grouped_rows = defaultdict(list)
+        planned_refs = []
+        for obj_instance in planned:
+            class_name = type(obj_instance).__name__
+            names = self.model_specs.get_object_attributes(class_name, indiv_key=False) + self.model_specs.get_references(class_name)
+            # One lookup per name, missing attributes are skipped without a second probe
+            args = {name: value for name in names if (value := getattr(obj_instance, name, _missing)) is not _missing}
             attrs, refs = self.model_specs.separate_attrs_refs(class_name, args)
-            query_create, expected_rel_created = self._construct_create_query(class_name, attrs, refs)
-        
-            # Execute the query
-            counters = transaction.run(query_create).consume().counters
-            if (counters.nodes_created != 1) or (counters.relationships_created != expected_rel_created):
-                raise ValueError(f"Error creating node or relationships in Neo4j. Expected 1 node and {expected_rel_created} relationships but got {counters.nodes_created} nodes and {counters.relationships_created} relationships.")
-                
-            def process_single_reference(expected_type, ref_obj):
-                if type(ref_obj).__name__ == expected_type:
-                    return self.get_object(ref_type, ref_obj.key)
-                return None
+            row, _ = self._construct_create_row(class_name, attrs, refs)
+            grouped_rows[class_name].append(row)
+            planned_refs.append((obj_instance, class_name, refs))
+        return grouped_rows, planned_refs
+
+    def _run_add_queries(self, run, grouped_rows, new_count, batch_size=None):
+        """
+        Merges the planned nodes and their relationships: all nodes first, so references among the added objects resolve.
+
+        Parameters:
+            run (callable): Runs a query, i.e. the run method of a transaction or, for batches, of a session.
+            grouped_rows (dict): Rows by class name, see _prepare_add_rows.
+            new_count (int): Number of nodes expected to be created.
+            batch_size (int): Optional number of rows to commit per inner transaction. Requires an auto-commit run.
+        """
+        def batched(query):
+            if not batch_size:
+                return query
+            return self._get_cached_query(("in_transactions", query, batch_size), lambda: self._in_transactions(query, batch_size))
+
+        nodes_created = 0
+        for class_name, rows in grouped_rows.items():
+            query = self._get_cached_query(("merge_nodes", class_name), lambda: merge_object_query.format(class_name=class_name))
+            nodes_created += run(batched(query), rows=rows).consume().counters.nodes_created
+        if nodes_created != new_count:
+            raise ValueError(f"Error creating nodes in Neo4j. Expected {new_count} nodes but got {nodes_created} nodes.")
+        for class_name, rows in grouped_rows.items():
+            for rel_name in self.model_specs.get_references(class_name):
+                links = [{"key": row["attrs"]["key"], "related_keys": row["refs"][rel_name]} for row in rows if row["refs"][rel_name]]
+                if links:
+                    run(batched(self._get_create_links_query(class_name, rel_name, merge=True)), links=links).consume()
+
+    @staticmethod
+    def _in_transactions(query: str, batch_size: int) -> str:
+        """
+        Wraps a query starting with 'UNWIND $... AS <row>' so the rows are committed in inner transactions of batch_size rows.
+        """
+        unwind, body = query.strip().split("\n", 1)
+        row_name = unwind.split()[-1]
+        return f"{unwind}\nCALL {{\n    WITH {row_name}\n{body}\n}} IN TRANSACTIONS OF {int(batch_size)} ROWS"
+
+    def _finish_add(self, planned_refs, tx):
+        """
+        Registers the added objects and points their references to the register objects.
+
+        Parameters:
+            planned_refs (list): (object, class name, references) per added object, see _prepare_add_rows.
+            tx: The active transaction.
+        """
+        # Put added objects in register
+        for obj_instance, class_name, _ in planned_refs:
+            self.get_type_register(class_name)[obj_instance.key] = obj_instance
+            self._forget_missing(class_name, obj_instance.key)
+
+        def process_single_reference(expected_type, ref_obj):
+            if type(ref_obj).__name__ == expected_type:
+                return self.get_object(expected_type, ref_obj.key, tx=tx)
+            return None
 
-            # Make sure that object references to register objects and not some random copy
+        # Make sure that object references to register objects and not some random copy
+        for obj_instance, class_name, refs in planned_refs:
+            reference_table = self._get_reference_table(class_name)
             for ref_name, ref_value in refs.items():
-                ref_type = self.model_specs.get_reference_type(class_name, ref_name)
-                is_multi = self.model_specs.is_multi_reference(class_name, ref_name)
+                ref_type, is_multi, _ = reference_table[ref_name]
+                if ref_value is None:
+                    continue
                 if is_multi:
                     if isinstance(ref_value, list):
                         if not ref_value: # if no objects are referenced, continue
@@ -716,44 +1305,53 @@ class ModelDB:
                         setattr(obj_instance, ref_name, processed_ref)
                     else:
                         raise ValueError(f"Unexpected Error: while post-processing the {ref_name} reference of {str(obj_instance)} the expected object {str(ref_value)} could not be acquired. Aborting...")
-            
-            # Put added object in register
-            self.get_type_register(class_name)[obj_instance.key] = obj_instance
-        if tx:
-            core_logic(tx)
-        else:
-            with self.driver.session() as session:
-                result = session.write_transaction(core_logic)
-                return result
 
-    def add_multiple_objects(self, obj_instances: List, tx=None) -> bool:
-        def do_work(transaction, obj_list):
-            added_objects = []
-            try:
-                for obj in obj_list:
-                    self.add_object(obj, transaction)
-                    added_objects.append(obj)
+    def add_object(self, obj_instance, tx=None) -> bool:
+        """
+        Synchronizes a given program object instance to the database.
+        If an object with the same key already exists in the database, it updates the existing object.
+        If not, it creates a new object in the database. Referenced objects that don't exist yet are added as well.
+
+        Parameters:
+            obj_instance: An instance of a model object.
+            tx: Optional transaction to run the database query.
+
+        Returns:
+            bool: True if the operation succeeded, False otherwise.
+        """
+        self._write(lambda transaction: self._add_objects([obj_instance], transaction), tx)
+        return True
+
+    def add_multiple_objects(self, obj_instances: List, tx=None, batch_size: int = None) -> bool:
+        """
+        Synchronizes the given program object instances and the objects they reference to the database, see add_object.
+
+        Parameters:
+            obj_instances (list): Instances of model objects.
+            tx: Optional transaction to run the database queries.
+            batch_size (int): Optional number of rows per committed batch for large imports. Only applies without tx.
+                The import is then no longer atomic: batches committed before an error stay in the database.
+
+        Returns:
+            bool: True if the operation succeeded, False otherwise.
+        """
+        try:
+            if batch_size and not tx:
+                # CALL { ... } IN TRANSACTIONS is only allowed in auto-commit queries, so the writes run on the session
+                with self.session_scope() as session:
+                    planned, new_count = self._read(lambda transaction: self._plan_add(obj_instances, transaction))
+                    if planned:
+                        grouped_rows, planned_refs = self._prepare_add_rows(planned)
+                        self._run_add_queries(session.run, grouped_rows, new_count, batch_size)
+                        self._read(lambda transaction: self._finish_add(planned_refs, transaction))
                 return True
-            except Exception as e:
-                print(f"Failed to add objects due to: {e}")
-                # If an exception happened, rollback changes by removing added objects from register
-                register = self.runtime.get_register()
-                for obj in added_objects:
-                    del register[type(obj).__name__][obj.key]
-                return False
-
-        if tx:  # If a transaction is already provided, use it.
-            return do_work(tx, obj_instances)
-
-        else:  # If no transaction is provided, create a session and then a transaction.
-            with self.driver.session() as session:
-                tx = session.begin_transaction()
-                success = do_work(tx, obj_instances)
-                if success:
-                    tx.commit()
-                else:
-                    tx.rollback()
-                return success
+            # Raising out of the managed transaction rolls it back
+            self._write(lambda transaction: self._add_objects(obj_instances, transaction), tx)
+            return True
+        except Exception as e:
+            print(f"Failed to add objects due to: {e}")
+            # Own transactions stage their registrations until the commit (see _run_managed), nothing to undo here
+            return False
 
     def add_composites(self, parent_type: str, parent_key: str, collection_name: str, composite_type: str, composites: List[dict]):
         """
@@ -770,41 +1368,20 @@ class ModelDB:
         - None
         """
 
-        with self.driver.session() as session:
-            # Start a transaction
-            tx = session.begin_transaction()
-
-            # Loop through each composite dict
-            for composite_data in composites:
-                # Validation of the composite's attributes can be done here if needed
-
-                # Generate a create query for the composite
-                node_attrs_list = []
-                for k, v in composite_data.items():
-                    if isinstance(v, datetime):
-                        formatted_datetime = v.isoformat()
-                        node_attr = f'{k}: datetime("{formatted_datetime}")'
-                    else:
-                        node_attr = f"{k}: {json.dumps(v)}"
-                    node_attrs_list.append(node_attr)
-
-                composite_attributes = ", ".join(node_attrs_list)
-                create_query = (
-                    f"MATCH (parent:{parent_type} {{key: '{parent_key}'}}) "
-                    f"CREATE (composite:{composite_type}:Composite {{{composite_attributes}}}), "
-                    f"(parent)-[:{collection_name} {{type: 'Collection'}}]->(composite)"
-                )
+        # Validation of the composites' attributes can be done here if needed
+        composite_rows = [{k: self._to_db_value(v) for k, v in composite_data.items()} for composite_data in composites]
+        query = self._get_cached_query(
+            ("add_composites", parent_type, collection_name, composite_type),
+            lambda: add_composites_query.format(parent_type=parent_type, collection_name=collection_name, composite_type=composite_type)
+        )
 
-                # Run the query
-                result = tx.run(create_query)
-                counters = result.consume().counters
-                # Check if the node and relationship were created correctly
-                if not counters.nodes_created == 1 or not counters.relationships_created == 1:
-                    tx.rollback()
-                    raise Exception("Error in creating the composite node or its relationship!")
+        def work(tx):
+            counters = tx.run(query, parent_key=parent_key, composites=composite_rows).consume().counters
+            # Check if every node and its relationship were created correctly
+            if counters.nodes_created != len(composite_rows) or counters.relationships_created != len(composite_rows):
+                raise Exception("Error in creating the composite nodes or their relationships!")
 
-            # If everything went well, commit the transaction
-            tx.commit()
+        self._write(work)
 
     def get_composites(self, parent_type: str, parent_key: str, collection_name: str, composite_type: str, **filter_params) -> List[tuple]:
         """
@@ -821,24 +1398,32 @@ class ModelDB:
         - List[tuple]: List of tuples, each representing a composite's attributes.
         """
 
-        # Generate the base query for retrieving composites
-        base_query = (
-            f"MATCH (parent:{parent_type} {{key: '{parent_key}'}})-[:{collection_name}]->(composite:{composite_type}) "
-        )
-
-        # Add filtering conditions if any filter_params are provided
-        if filter_params:
-            filters = [f"composite.{key}='{value}'" for key, value in filter_params.items()]
-            base_query += f" WHERE {' AND '.join(filters)}"
-
         # Acquire the attributes associated with the composite type from model_specs
         composite_attributes = self.model_specs.get_composite_attributes(composite_type)
-        
-        # Add the attributes to the RETURN clause of the query
-        base_query += " RETURN " + ', '.join([f"composite.{attr}" for attr in composite_attributes])
 
-        with self.driver.session() as session:
-            result = session.run(base_query)
+        invalid_filters = set(filter_params) - set(composite_attributes)
+        if invalid_filters:
+            raise ValueError(f"Invalid filters for composite {composite_type}: {', '.join(invalid_filters)}")
+        query_params = {"parent_key": parent_key, **{f"filter_{key}": self._to_db_value(value) for key, value in filter_params.items()}}
+
+        def build():
+            # Generate the base query for retrieving composites
+            base_query = (
+                f"MATCH (parent:{parent_type} {{key: $parent_key}})-[:{collection_name}]->(composite:{composite_type}) "
+            )
+
+            # Add filtering conditions if any filter_params are provided
+            if filter_params:
+                filters = [f"composite.{key} = $filter_{key}" for key in filter_params]
+                base_query += f" WHERE {' AND '.join(filters)}"
+
+            # Add the attributes to the RETURN clause of the query
+            return base_query + " RETURN " + ', '.join([f"composite.{attr}" for attr in composite_attributes])
+
+        base_query = self._get_cached_query(("composites", parent_type, collection_name, composite_type, tuple(filter_params)), build)
+
+        with self.session_scope() as session:
+            result = session.run(base_query, query_params)
             
             # Compile the return list
             composites = []
@@ -863,26 +1448,21 @@ class ModelDB:
         """
 
         # 1. Object Lookup
-        obj = self.get_object(class_name, key)
+        obj = self.get_object(class_name, key, tx=tx)
         if not obj:
             raise ValueError(f"No object of type {class_name} with key {key} found.")
         
         # 2. Generate Query to Detach Relationships and Delete Node
-        query = f"""
-        MATCH (n:{class_name} {{key: $key}})
-        DETACH DELETE n
-        """
+        index_hint = self._get_index_hint(class_name)
+        query = self._get_cached_query(("delete", class_name, index_hint), lambda: delete_object_query.format(class_name=class_name, index_hint=index_hint))
         
         # 3. Execute Query and Check Result
-        if tx:
-            result = tx.run(query, {"key": key})
-        else:
-            with self.driver.session() as session:
-                result = session.run(query, {"key": key})
+        def work(tx):
+            counters = tx.run(query, {"key": key}).consume().counters  # Get the counters
+            if counters.nodes_deleted != 1:
+                raise RuntimeError(f"Failed to delete object of type {class_name} with key {key}.")
 
-        counters = result.consume().counters  # Get the counters
-        if counters.nodes_deleted != 1:
-            raise RuntimeError(f"Failed to delete object of type {class_name} with key {key}.")
+        self._write(work, tx)
         
         # 4. Delete from Register
         register = self.get_type_register(class_name)
@@ -890,6 +1470,43 @@ class ModelDB:
         
         return f"Object of type {class_name} with key {key} successfully deleted."
     
+    def delete_objects_bulk(self, objects_to_delete: List[Tuple[str, str]], tx=None):
+        """
+        Deletes multiple existing objects with one query per class. Each object is identified by its class_name and key.
+        Deletes both the objects' representation in the program and in the database.
+        The existence of all objects is checked with one query per class first. If any of them doesn't exist, nothing is deleted.
+
+        Parameters:
+            objects_to_delete (list): List of tuples. Each tuple consists of class_name (str) and key (str).
+            tx (Transaction, optional): An optional Neo4j transaction. If not provided, a new session and transaction will be started.
+        """
+        # Group by class_name, listing each key once
+        grouped_keys = defaultdict(dict)
+        for class_name, key in objects_to_delete:
+            grouped_keys[class_name][key] = None
+
+        def work(tx):
+            # Check that every object exists before anything is deleted
+            for class_name, keys in grouped_keys.items():
+                query = self._get_cached_query(("exist_many", class_name), lambda: objects_exist_query.format(class_name=class_name))
+                for record in tx.run(query, keys=list(keys)):
+                    if not record['found']:
+                        raise ValueError(f"No object of type {class_name} with key {record['k']} found.")
+            for class_name, keys in grouped_keys.items():
+                index_hint = self._get_index_hint(class_name)
+                query = self._get_cached_query(("delete_many", class_name, index_hint), lambda: delete_objects_query.format(class_name=class_name, index_hint=index_hint))
+                counters = tx.run(query, keys=list(keys)).consume().counters
+                if counters.nodes_deleted != len(keys):
+                    raise RuntimeError(f"Failed to delete objects of type {class_name}. Expected {len(keys)} deleted nodes but got {counters.nodes_deleted}.")
+
+        self._write(work, tx)
+
+        # Delete from Register
+        for class_name, keys in grouped_keys.items():
+            register = self.get_type_register(class_name)
+            for key in keys:
+                register.pop(key, None)
+
     def delete_multiple_objects(self, objects_to_delete: List[Tuple[str, str]]): # TODO: Test
         """
         Deletes multiple existing objects. Each object is identified by its class_name and key.
@@ -901,20 +1518,8 @@ class ModelDB:
         Returns:
             List of success or error messages for each deleted object.
         """
-        messages = []
-
-        with self.driver.session() as session:
-            tx = session.begin_transaction()
-            try:
-                for class_name, key in objects_to_delete:
-                    message = self.delete_object(class_name, key, tx=tx)
-                    messages.append(message)
-                tx.commit()
-            except:
-                tx.rollback()
-                raise
-
-        return messages
+        self.delete_objects_bulk(objects_to_delete)
+        return [f"Object of type {class_name} with key {key} successfully deleted." for class_name, key in dict.fromkeys(objects_to_delete)]
 
     def clone_object(self, class_name: str, key: str, new_key: str):
         # Check if source object exists
@@ -926,26 +1531,30 @@ class ModelDB:
         if self.get_object(class_name, new_key):
             raise ValueError(f"An object of type {class_name} with key {new_key} already exists.")
 
-        # Extract the attributes and references from the source object
-        class_info = self.model_specs.model_objects.get(class_name)
-        attributes = [attr for attr, _ in class_info['attributes'].items() if attr != class_info['key']]
-        references = [ref for ref, _ in class_info['references'].items()]
-
-        args = {}
-        for attr in attributes:
-            value = getattr(src_object, attr)
-            if value is not None:
-                args[attr] = value
-        for ref in references:
-            value = getattr(src_object, ref)
-            if value is not None:
-                args[ref] = value
-
-        # Update the key
-        args['key'] = new_key
-
-        # Create the new object using the existing functionality
-        cloned_obj = self.create_object(class_name, args)
+        # Copy the stored properties and relationships on the database side, the new node only differs in its key
+        def build():
+            clauses = [clone_object_query.format(class_name=class_name)]
+            for rel_name, (related_class, _, inv_rel_type) in self._get_reference_table(class_name).items():
+                clauses.append(clone_reference_clause.format(
+                    relationship_type=rel_name.upper(),
+                    related_class=related_class,
+                    inverse_clause=f" CREATE (b)-[:{inv_rel_type}]->(dst)" if inv_rel_type else ""
+                ))
+            clauses.append(clone_return_clause)
+            return "".join(clauses)
+
+        query = self._get_cached_query(("clone", class_name), build)
+
+        def work(tx):
+            # The query returns the new node with its relationships, so the object is built from what was stored
+            record = tx.run(query, key=key, new_key=new_key).single()
+            if record is None:
+                raise ValueError(f"Error cloning object of type {class_name} with key {key} in Neo4j.")
+            # The lookup above remembered the new key as missing
+            self._forget_missing(class_name, new_key)
+            return self.object_from_node(class_name, record['main_node'], record['relationships'])
+
+        cloned_obj = self._write(work)
 
         return cloned_obj
 
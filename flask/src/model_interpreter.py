@@ -1,13 +1,12 @@
 import re
 import os
+import mmap
 import random
 import string
 from src.runtime_manager import RuntimeManager
 from src.dm_specs import ModelSpecifications
 from src.model_db import ModelDB
 
-valid_commands = ["get", "create", "add", "io", "help"]
-
 command_help = """
 _______ Command Usage _______
 
@@ -41,6 +40,28 @@ _______ Referring to Model Objects _______
 
 BASIC_TYPES = {float, int, str}
 
+# Matches int literals as Python accepts them: ASCII digits without leading zeros, e.g. "-12", "0"
+INT_PATTERN = re.compile(r'-?(0|[1-9][0-9]*)')
+
+# Matches float literals, e.g. "-1.5", ".5", "2e10". ASCII digits only, and a point or an exponent is required,
+# so that integers with leading zeros like "007" are left to the runtime, which rejects them
+FLOAT_PATTERN = re.compile(r'-?(([0-9]+\.[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?|[0-9]+[eE][-+]?[0-9]+)')
+
+# Matches @Class.Key mentions and the call they are replaced with
+MENTION_PATTERN = re.compile(r'@(\w+)\.(\w+)(?=\W|$)')
+MENTION_REPLACEMENT = '__get_model_object__("\\1", "\\2")'
+# Inputs with more '@' than this are rewritten in a single joined pass instead of re.sub
+MENTION_JOIN_THRESHOLD = 4
+
+# Matches a whitespace separated command argument; quoted strings within it may contain whitespace
+ARGUMENT_PATTERN = re.compile(r'''(?:"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|\S)+''')
+
+# Error texts longer than this are cut off in responses
+ERROR_MESSAGE_LIMIT = 512
+
+# Payload files larger than this (bytes) are memory-mapped and decoded in place instead of read into a buffer first
+MMAP_READ_THRESHOLD = 1 << 20
+
 class ModelInterpreter:
 
 # region Constructor and @property Attributes
@@ -49,6 +70,14 @@ class ModelInterpreter:
         self.runtime: RuntimeManager = runtime
         self.model_specs = specs
         self.db: ModelDB = db
+        # Handler per command name, bound once
+        self._command_handlers = {
+            "get": self.process_get,
+            "create": self.process_create,
+            "add": self.process_add,
+            "io": self.process_io,
+            "help": self.process_help
+        }
 
 # endregion
 
@@ -60,62 +89,145 @@ class ModelInterpreter:
         return {"result": str(message), "objects": self.runtime.get_runtime_objects()}
 
     def _interpret_input(self, input_str):
+        # Without an '@' there is nothing to replace
+        if '@' not in input_str:
+            return input_str
         # Recognize all @Class.Key mentions and replace accordingly
-        pattern = r'@([\w]+)\.([\w]+)(?=\W|$)'  # This regex captures @Class.Key
-        replacement = '__get_model_object__("\\1", "\\2")'  # Replacement pattern for the recognized mentions
+        if input_str.count('@') <= MENTION_JOIN_THRESHOLD:
+            return MENTION_PATTERN.sub(MENTION_REPLACEMENT, input_str)
+        # Many mentions: collect the pieces and join them once
+        parts = []
+        last = 0
+        for match in MENTION_PATTERN.finditer(input_str):
+            parts.append(input_str[last:match.start()])
+            parts.append(f'__get_model_object__("{match.group(1)}", "{match.group(2)}")')
+            last = match.end()
+        parts.append(input_str[last:])
+        return ''.join(parts)
+
+    def _split_arguments(self, command_str: str):
+        """
+        Splits command arguments at whitespace in one pass. Quoted strings stay part of their argument,
+        so values like name="a b" are kept together.
+
+        Returns:
+            List of the argument tokens.
+        """
+        return ARGUMENT_PATTERN.findall(command_str)
+
+    def _split_assignments(self, tokens, start: int = 1, allow_as: bool = False):
+        """
+        Splits attribute/reference=value tokens into names and value expressions in one pass.
 
-        interpreted_input = re.sub(pattern, replacement, input_str)
-        return interpreted_input
+        Parameters:
+            tokens: The argument tokens.
+            start (int): Index of the first attribute/reference=value token.
+            allow_as (bool): Whether the tokens may end with 'as <name>'. Tokens after the name are ignored.
+
+        Returns:
+            Tuple of the list of names, the list of corresponding value expressions and the name given after 'as' (or None).
+
+        Raises:
+            ValueError: If a token is not of the form name=value or 'as' is not followed by a name.
+        """
+        names, value_strs = [], []
+        for index in range(start, len(tokens)):
+            token = tokens[index]
+            if allow_as and token == "as":
+                # The next argument should be the name of the result
+                if index + 1 >= len(tokens):
+                    raise ValueError("Expected a name after 'as'.")
+                return names, value_strs, tokens[index + 1]
+            name, separator, value_str = token.partition("=")
+            if not separator:
+                raise ValueError(f"Invalid argument format: {token}")
+            if not value_str.strip():
+                raise ValueError(f"Missing value in argument: {token}")
+            names.append(name)
+            value_strs.append(value_str)
+        return names, value_strs, None
+
+    def _evaluate_values(self, value_strs):
+        """
+        Evaluates the value expressions of attribute/reference=value tokens.
+        Several values are parsed one by one and evaluated at once as a single tuple, see RuntimeManager.evaluate_values.
+        Values have to be expressions, anything else raises instead of being executed.
+
+        Returns:
+            List of the evaluated values in the order of value_strs.
+        """
+        if len(value_strs) == 1:
+            return [self.evaluate_value(value_strs[0])]
+        values = self.runtime.evaluate_values([self._interpret_input(value_str) for value_str in value_strs])
+        if len(values) != len(value_strs):
+            raise ValueError(f"Expected {len(value_strs)} values but got {len(values)}.")
+        return list(values)
+
+    def _format_error(self, context: str, error: Exception) -> str:
+        """
+        Builds an error response of a context description and the error's text, cut off after ERROR_MESSAGE_LIMIT characters.
+        """
+        text = str(error)
+        if len(text) > ERROR_MESSAGE_LIMIT:
+            text = text[:ERROR_MESSAGE_LIMIT] + "..."
+        return context + text
 
     def _generate_random_name(self, length=8):
         # Generate a random name for storing the result if no name is provided
         return ''.join(random.choice(string.ascii_lowercase) for _ in range(length))
 
     def process_request(self, input_str: str):
-        # Check if the input starts with a special command indicator ('>')
-        if input_str.startswith('>'):
-            result = self.process_command(input_str[1:].strip())  # Remove the '>' and pass the rest
-        else:
-            try:
-                result = self.execute_expression(input_str)
-            except Exception as e:
-                result = f"Error occurred during execution of {input_str}:\r\n{str(e)}"
+        # All database queries of a request share one session
+        with self.db.session_scope():
+            # Check if the input starts with a special command indicator ('>')
+            if input_str.startswith('>'):
+                result = self.process_command(input_str[1:].strip())  # Remove the '>' and pass the rest
+            else:
+                try:
+                    result = self.execute_expression(input_str)
+                except Exception as e:
+                    result = self._format_error(f"Error occurred during execution of {input_str}:\r\n", e)
         return self._generate_response(str(result))
 
     def execute_expression(self, expression: str):
-        exp = self._interpret_input(expression)
-        # If the expression contains '=', assume it's an assignment and use exec
-        if '=' in exp:
-            # Execute the assignment - TODO: make robust against malicious code execution
-            self.runtime.execute(exp)
-            # Parse the variable name and retrieve its value
-            var_name = expression.split('=')[0].strip()
-            result = self.runtime.get_from_scope(var_name)
-        else:
-            # Otherwise, assume it's an expression and use eval
-            result = self.runtime.evaluate(exp)
-        return result
+        """
+        Runs top-level input. Expressions return their value, statements are executed and report their outcome,
+        errors included, as message.
+        """
+        # Numeric literals are the most common input; resolve them without compiling an expression
+        if expression and (expression[0] == '-' or expression[0].isdigit()):
+            if INT_PATTERN.fullmatch(expression):
+                return int(expression)
+            if FLOAT_PATTERN.fullmatch(expression):
+                return float(expression)
+
+        # The runtime tells expressions (eval) from assignments and other statements (exec) by their syntax tree
+        # TODO: make robust against malicious code execution
+        return self.runtime.run(self._interpret_input(expression))
+
+    def evaluate_value(self, expression: str):
+        """
+        Evaluates a value given to a command. Unlike execute_expression, the input has to be an expression:
+        empty input and statements raise a SyntaxError, and errors of the evaluation propagate.
+        """
+        # Numeric literals are the most common argument values; resolve them without compiling an expression
+        if expression and (expression[0] == '-' or expression[0].isdigit()):
+            if INT_PATTERN.fullmatch(expression):
+                return int(expression)
+            if FLOAT_PATTERN.fullmatch(expression):
+                return float(expression)
+        # TODO: make robust against malicious code execution
+        return self.runtime.evaluate(self._interpret_input(expression))
 
     def process_command(self, command_str):
-        # Split the input to identify the command and its arguments
-        parts = command_str.split(maxsplit=1)  # maxsplit ensures only the first space is considered
-        command = parts[0]
-        if not command in valid_commands:
+        # Peek at the command token first, so unknown commands are rejected before the arguments are touched.
+        # Any whitespace separates it, tabs and repeated spaces included
+        parts = command_str.split(None, 1)
+        command = parts[0] if parts else ""
+        handler = self._command_handlers.get(command)
+        if handler is None:
             return f"Unknown command: {command}"
-        arguments = parts[1] if len(parts) > 1 else ""
-
-        # Determine which command to process
-        if command == "add":
-            return self.process_add(arguments)
-        elif command == "create":
-            return self.process_create(arguments)
-        elif command == "get":
-            return self.process_get(arguments)
-        elif command == "io":
-            return self.process_io(arguments)
-        elif command == "help":
-            return self.process_help(arguments)
-        return f"Unknown command: {command}"
+        return handler(parts[1].strip() if len(parts) > 1 else "")
 
 # region command processing
 
@@ -149,7 +261,7 @@ class ModelInterpreter:
         > get ClassName -help
         """
         # Split the arguments
-        args = command_str.split()
+        args = self._split_arguments(command_str)
 
         # Validate if the class name is provided
         if not args:
@@ -160,38 +272,33 @@ class ModelInterpreter:
         if len(args) > 1 and args[1] == "-help":
             return "\n".join(self.model_specs.get_variable_summary(class_name))
 
-        # Process the attribute/reference specifications
-        filter_args = {}
-        list_name = None
-        for arg in args[1:]:
-            if arg == "as":
-                # The next argument should be the name of the list
-                try:
-                    list_name = args[args.index(arg) + 1]
-                except IndexError:
-                    return "Expected a name after 'as'."
-                break
-            elif "=" in arg:
-                key, value = arg.split("=", 1)
-                filter_args[key] = self.execute_expression(value)
-            else:
-                return f"Invalid argument format: {arg}"
+        # Process the attribute/reference specifications, optionally followed by 'as <name>'
+        try:
+            keys, value_strs, list_name = self._split_assignments(args, allow_as=True)
+        except ValueError as e:
+            return str(e)
+        try:
+            filter_args = dict(zip(keys, self._evaluate_values(value_strs)))
+        except Exception as e:
+            return self._format_error("Error occurred during evaluation of arguments: ", e)
 
         # If no name is provided, generate a random one
         if not list_name:
             list_name = self._generate_random_name()
 
-        # Fetch the objects using the filter arguments
-        objects = self.db.find_objects(class_name, filter_args)
-
-        if not objects:
+        # Stream the objects matching the filter arguments, peeking whether there are none, one or more
+        objects = self.db.find_objects_stream(class_name, filter_args)
+        first = next(objects, None)
+        if first is None:
             return f"No objects of type {class_name} matching the criteria found."
+        second = next(objects, None)
 
         # If only one object, store it directly. Otherwise, store as a list.
-        if len(objects) == 1:
-            self.runtime.set_to_scope(list_name, objects[0])
+        if second is None:
+            self.runtime.set_to_scope(list_name, first)
             return f"Object of type {class_name} added as {list_name}."
         else:
+            objects = [first, second, *objects]
             self.runtime.set_to_scope(list_name, objects)
             return f"{len(objects)} objects of type {class_name} added to {list_name}."
 
@@ -214,14 +321,14 @@ class ModelInterpreter:
         """
         
         # Split the arguments
-        args = command_str.split()
+        args = self._split_arguments(command_str)
 
         # Validate if the class name is provided and is known
         if not args:
             return "No arguments provided."
         
         class_name = args[0]
-        if class_name not in self.model_specs.get_class_names():
+        if class_name not in self.model_specs.get_class_names_set():
             return "Unknown Object Type."
 
         # If only the class name is provided or if help is requested
@@ -229,21 +336,21 @@ class ModelInterpreter:
             return "\n".join(self.model_specs.get_variable_summary(class_name))
 
         # Process the attribute/reference specifications
-        init_params = {}
-        for arg in args[1:]:
-            key, value_str = arg.split("=", 1)
-            try:
-                value = self.execute_expression(value_str)
-                init_params[key] = value
-            except Exception as e:
-                return f"Error occurred during evaluation of {value_str}: {str(e)}"
+        try:
+            keys, value_strs, _ = self._split_assignments(args)
+        except ValueError as e:
+            return str(e)
+        try:
+            init_params = dict(zip(keys, self._evaluate_values(value_strs)))
+        except Exception as e:
+            return self._format_error("Error occurred during evaluation of arguments: ", e)
 
         # Create the object
         try:
             obj = self.db.create_object(class_name, init_params)
             return str(obj)
         except Exception as e:
-            return f"Error occurred during object creation: {str(e)}"
+            return self._format_error("Error occurred during object creation: ", e)
 
     def process_add(self, expression: str) -> str:
         """
@@ -263,9 +370,9 @@ class ModelInterpreter:
         
         try:
             # Evaluate the expression
-            result = self.execute_expression(expression)
+            result = self.evaluate_value(expression)
 
-            valid_classes = self.model_specs.get_class_names()
+            valid_classes = self.model_specs.get_class_names_set()
             # Check if the result is a list of known model objects
             if isinstance(result, list) and all(type(item).__name__ in valid_classes for item in result):
                 if self.db.add_multiple_objects(result):
@@ -286,7 +393,7 @@ class ModelInterpreter:
                 return f"Expression does not evaluate to a recognized model object or list of model objects."
 
         except Exception as e:
-            return f"Error occurred during evaluation: {str(e)}"
+            return self._format_error("Error occurred during evaluation: ", e)
         
     def process_io(self, command: str) -> str:
         """
@@ -378,11 +485,36 @@ Usage for 'add' command:
         Returns:
             str: List of files in the payload bay.
         """
-        files = os.listdir("payload_bay")
+        # scandir yields the entry types with the directory listing, so no extra stat per file is needed
+        with os.scandir("payload_bay") as entries:
+            files = [entry.name for entry in entries if entry.is_file()]
         if not files:
             return "Payload bay is empty."
         return "\n".join(files)
 
+    def _read_payload(self, filename: str) -> str:
+        """
+        Read the content of a file in the payload bay as text with normalized line endings.
+
+        Args:
+            filename (str): Name of the file.
+
+        Returns:
+            str: Content of the file.
+        """
+        with open(os.path.join("payload_bay", filename), 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size > MMAP_READ_THRESHOLD:
+                # Decode straight from the mapped pages, without an intermediate bytes copy
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = str(mapped, 'utf-8')
+            else:
+                content = file.read().decode('utf-8')
+        # Same line endings as reading in text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
     def _read_file_to_variable(self, filename: str, var_name: str = None) -> str:
         """
         Read the file content and store it in a variable.
@@ -394,8 +526,7 @@ Usage for 'add' command:
         Returns:
             str: Confirmation message.
         """
-        with open(os.path.join("payload_bay", filename), 'r') as file:
-            content = file.read()
+        content = self._read_payload(filename)
         
         var_name = var_name or filename
         # Store the content in a variable
@@ -434,8 +565,7 @@ Usage for 'add' command:
             if not target_function:
                 return f"Error: {function_str} not found."
 
-        with open(os.path.join("payload_bay", filename), 'r') as file:
-            content = file.read()
+        content = self._read_payload(filename)
 
         # Process the content using the target function
         result = target_function(content)
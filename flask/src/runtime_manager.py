@@ -1,3 +1,6 @@
+import ast
+import builtins
+import functools
 import importlib
 import sys
 import json
@@ -10,6 +13,114 @@ class ModuleUnavailableError(RuntimeError):
 
 known_dicts = ["INVERSE_RELATIONSHIPS", "register"]
 
+# Type names of scope members that aren't shown as runtime objects: classes, modules and functions
+excluded_type_names = frozenset({"type", "ABCMeta", "module", "function", "builtin_function_or_method"})
+
+# Builtins that are withheld from evaluated input as they reach beyond the loaded model (imports, file access, nested code execution)
+restricted_builtins = {"__import__", "breakpoint", "compile", "eval", "exec", "exit", "help", "input", "open", "quit"}
+safe_builtins = {name: value for name, value in vars(builtins).items() if name not in restricted_builtins}
+
+# Placeholder for scope names that no longer exist
+_missing = object()
+
+# Inputs longer than this are compiled on every call instead of being kept in the compile cache
+compile_cache_limit = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_cached(source: str, mode: str):
+    return compile(source, "<input>", mode)
+
+
+def _compile(source: str, mode: str):
+    """
+    Compiles evaluated input to a code object. Repeated inputs reuse the cached code object.
+
+    Parameters:
+        source (str): The code to compile.
+        mode (str): 'eval' for expressions, 'exec' for statements.
+    """
+    if len(source) > compile_cache_limit:
+        return compile(source, "<input>", mode)
+    return _compile_cached(source, mode)
+
+
+def _compile_values_uncached(sources: tuple):
+    elements = [ast.parse(source, "<input>", "eval").body for source in sources]
+    return compile(ast.fix_missing_locations(ast.Expression(ast.Tuple(elements, ast.Load()))), "<input>", "eval")
+
+
+_compile_values_cached = functools.lru_cache(maxsize=512)(_compile_values_uncached)
+
+
+def _compile_values(sources: tuple):
+    """
+    Compiles several expressions to one code object evaluating to the tuple of their values.
+    Each expression is parsed on its own, so no expression can change how the others are read, and an empty
+    or non-expression source raises a SyntaxError.
+
+    Parameters:
+        sources (tuple): The expressions to compile.
+    """
+    if sum(map(len, sources)) > compile_cache_limit:
+        return _compile_values_uncached(sources)
+    return _compile_values_cached(sources)
+
+
+def _bound_names(tree: ast.AST) -> tuple:
+    """
+    Collects the names a parsed input can bind. Names bound inside functions are included as well,
+    they are simply not found in the scope later on.
+    """
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Store):
+                names[node.id] = None
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names[node.name] = None
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names[alias.asname or alias.name.partition(".")[0]] = None
+        elif isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar)):
+            if node.name:
+                names[node.name] = None
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            names[node.rest] = None
+    return tuple(names)
+
+
+def _compile_input_uncached(source: str):
+    tree = ast.parse(source, "<input>", "exec")
+    body = tree.body
+    bound_names = _bound_names(tree)
+    if len(body) == 1 and isinstance(body[0], ast.Expr):
+        return compile(ast.Expression(body[0].value), "<input>", "eval"), True, None, bound_names
+    target = None
+    if len(body) == 1 and isinstance(body[0], ast.Assign) and len(body[0].targets) == 1 and isinstance(body[0].targets[0], ast.Name):
+        target = body[0].targets[0].id
+    return compile(tree, "<input>", "exec"), False, target, bound_names
+
+
+_compile_input_cached = functools.lru_cache(maxsize=512)(_compile_input_uncached)
+
+
+def _compile_input(source: str):
+    """
+    Parses evaluated input once and compiles it according to its syntax. A single expression is compiled for eval,
+    anything else (assignments, other statements, multiple statements) for exec.
+
+    Parameters:
+        source (str): The input to compile.
+
+    Returns:
+        tuple: (code object, whether the input is an expression, name assigned by a single-name assignment or None,
+            names the input can bind)
+    """
+    if len(source) > compile_cache_limit:
+        return _compile_input_uncached(source)
+    return _compile_input_cached(source)
+
 
 class RuntimeManager:
     def __init__(self, module_path: str):
@@ -17,6 +128,9 @@ class RuntimeManager:
         self.module_name = ""
         self.loaded_module = None
         self.execution_scope = {}
+        # Scope names provided by the loaded module and names that can hold runtime objects (dict keeps insertion order)
+        self._baseline_keys = frozenset()
+        self._user_keys = {}
 
         self.load_module(module_path)
 
@@ -35,8 +149,12 @@ class RuntimeManager:
         if not hasattr(self.loaded_module, "register"):
             setattr(self.loaded_module, "register", {})
 
-        # add module members to execution scope
+        # add module members to execution scope, evaluated input only gets the prebuilt restricted builtins
         self.execution_scope = dict(self.loaded_module.__dict__)
+        self.execution_scope["__builtins__"] = safe_builtins
+        # Module members that aren't classes, functions etc. count as runtime objects from the start
+        self._baseline_keys = frozenset(self.execution_scope)
+        self._user_keys = {name: None for name, value in self.execution_scope.items() if self._is_runtime_object(name, value)}
 
     def _unload_module(self):
         """Unload the currently loaded module."""
@@ -76,18 +194,67 @@ class RuntimeManager:
 
     def execute(self, code: str):
         """Execute a block of code within the managed scope."""
+        compiled, _, _, bound_names = _compile_input(code)
+        scope_size = len(self.execution_scope)
         try:
-            exec(code, self.execution_scope)
+            exec(compiled, self.execution_scope)
         except Exception as e:
             return str(e)
+        finally:
+            self._track_user_keys(bound_names, scope_size)
         return "Code executed successfully."
 
     def evaluate(self, expression: str):
         """Evaluate an expression and return its result."""
-        return eval(expression, self.execution_scope)
+        return eval(_compile(expression, "eval"), self.execution_scope)
+
+    def evaluate_values(self, expressions) -> tuple:
+        """Evaluate several expressions with a single eval and return their results as a tuple, see _compile_values."""
+        return eval(_compile_values(tuple(expressions)), self.execution_scope)
     
+    def run(self, source: str):
+        """
+        Run input within the managed scope. Expressions are evaluated and their value is returned. Statements are
+        executed; for an assignment to a single name the assigned value is returned, otherwise the execution message.
+        """
+        code, is_expression, target, bound_names = _compile_input(source)
+        scope_size = len(self.execution_scope)
+        if is_expression:
+            try:
+                return eval(code, self.execution_scope)
+            finally:
+                # Only assignment expressions bind names while evaluating
+                if bound_names:
+                    self._track_user_keys(bound_names, scope_size)
+        try:
+            exec(code, self.execution_scope)
+        except Exception as e:
+            return str(e)
+        finally:
+            self._track_user_keys(bound_names, scope_size)
+        if target is None:
+            return "Code executed successfully."
+        return self.execution_scope.get(target, None)
+
+    def _track_user_keys(self, bound_names: tuple, scope_size: int):
+        """
+        Records the names executed input bound, as read from its syntax tree. Module members it rebound are included.
+        Only if the scope grew by more names than the input can bind, e.g. through globals(), the scope is scanned.
+
+        Parameters:
+            bound_names (tuple): Names the input can bind, see _compile_input.
+            scope_size (int): Number of scope names before the input was executed.
+        """
+        user_keys = self._user_keys
+        user_keys.update(dict.fromkeys(bound_names))
+        scope = self.execution_scope
+        if len(scope) - scope_size > len(bound_names):
+            baseline_keys = self._baseline_keys
+            user_keys.update(dict.fromkeys(name for name in scope if name not in baseline_keys and name not in user_keys))
+
     def set_to_scope(self, attr_name: str, value):
         self.execution_scope[attr_name] = value
+        self._user_keys[attr_name] = None
 
     def get_attr(self, attr_name: str):
         return getattr(self.loaded_module, attr_name, None)
@@ -119,6 +286,20 @@ class RuntimeManager:
             general_register[class_name] = {}
         return general_register[class_name]
 
+    @staticmethod
+    def _is_runtime_object(attr_name: str, value) -> bool:
+        """Whether a scope member is shown as runtime object."""
+        if attr_name.startswith("_"):  # Exclude private members
+            return False
+        if attr_name in known_dicts:
+            return False
+        value_type = value.__class__
+        if value_type.__name__ in excluded_type_names: # Exclude classes, modules and functions
+            return False
+        if getattr(value_type, "__module__", "") == "typing": # Exclude typing module members
+            return False
+        return True
+
     def get_runtime_objects(self):
         response = {
             "model_objects": {},
@@ -138,26 +319,29 @@ class RuntimeManager:
             ]
         
         # Handle other runtime objects
-        for attr_name, value in self.execution_scope.items():
-            if attr_name.startswith("_"):  # Exclude private members
-                continue
-            if attr_name in known_dicts:
-                continue
-            if type(value).__name__ in ["type", "ABCMeta", "module", "function"]: # Exclude classes, modules and functions
+        lists = response["runtime_objects"]["lists"]
+        dicts = response["runtime_objects"]["dicts"]
+        variables = response["runtime_objects"]["variables"]
+        # Only names set by the user or holding module variables are scanned, not every module member
+        scope = self.execution_scope
+        for attr_name in self._user_keys:
+            value = scope.get(attr_name, _missing)
+            if value is _missing:  # Name was deleted from the scope
                 continue
-            if str(value).startswith("typing."): # Exclude typing module members
+            if not self._is_runtime_object(attr_name, value):
                 continue
+            type_name = value.__class__.__name__
             obj_repr = {"name": attr_name}
             if isinstance(value, list):
-                obj_repr["content"] = [{"type": type(item).__name__, "value": str(item)} for i, item in enumerate(value)]
-                response["runtime_objects"]["lists"].append(obj_repr)
+                obj_repr["content"] = [{"type": type(item).__name__, "value": str(item)} for item in value]
+                lists.append(obj_repr)
             elif isinstance(value, dict):
                 obj_repr["content"] = [{"key": str(k), "type": type(v).__name__, "value": str(v)} for k, v in value.items()]
-                response["runtime_objects"]["dicts"].append(obj_repr)
+                dicts.append(obj_repr)
             else:
-                obj_repr["type"] = type(value).__name__
+                obj_repr["type"] = type_name
                 obj_repr["content"] = str(value)
-                response["runtime_objects"]["variables"].append(obj_repr)
+                variables.append(obj_repr)
         
         return response
 